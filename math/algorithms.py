@@ -2,10 +2,33 @@
 Algorithm Utilities Module - Collection of common algorithms for problem solving.
 
 This module provides implementations of various algorithms including:
-- Two Sum problem solution
+- Two Sum problem solution, with batch, sorted, k-sum and streaming variants
 - Array/list manipulation algorithms
+- Mergeable maximum subarray summaries for chunked and parallel input
+- Segment tree for range maximum subarray queries with point updates
+- Binary search over memory-mapped files of fixed-width records
+- Reusable sorted index for bulk binary search lookups
+- Stable bottom-up merge sort with an optional process-pool mode
+- Lazy k-way merge of sorted iterables
+- External merge sort for files larger than memory
 """
 
+import functools
+import heapq
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
 def two_sum(numbers, target):
     """
     Find two numbers in the list that add up to the target.
@@ -33,6 +56,228 @@ def two_sum(numbers, target):
     return None
 
 
+class TwoSumIndex:
+    """Index over a list of numbers for answering many two-sum queries."""
+    
+    def __init__(self, numbers):
+        """
+        Initialize a new TwoSumIndex.
+        
+        Args:
+            numbers (list): List of integers
+        """
+        self.numbers = list(numbers)
+        
+        # Map each distinct value to the ascending indices where it occurs
+        self.positions = {}
+        for i, num in enumerate(self.numbers):
+            self.positions.setdefault(num, []).append(i)
+        self.first = {num: indices[0] for num, indices in self.positions.items()}
+    
+    def find(self, target):
+        """
+        Find one pair of numbers that add up to the target.
+        
+        Args:
+            target (int): Target sum
+        
+        Returns:
+            tuple: Indices (i, j) with i < j, or None if no such pair exists
+        """
+        # Walk j in index order and stop at the first completed pair, as
+        # two_sum does, but look up the complement's first index instead of
+        # building a dict per query
+        first = self.first
+        for j, num in enumerate(self.numbers):
+            i = first.get(target - num, j)
+            if i < j:
+                return (i, j)
+        return None
+    
+    def find_many(self, targets):
+        """
+        Find one pair of numbers for each of many targets.
+        
+        Args:
+            targets (iterable): Target sums
+        
+        Returns:
+            list: find(target) for each target
+        """
+        return [self.find(target) for target in targets]
+    
+    def all_pairs(self, target):
+        """
+        Find every pair of numbers that add up to the target.
+        
+        Args:
+            target (int): Target sum
+        
+        Returns:
+            list: Sorted list of index pairs (i, j) with i < j
+        """
+        pairs = []
+        for num, indices in self.positions.items():
+            complement = target - num
+            if complement == num:
+                pairs.extend((indices[a], indices[b])
+                             for a in range(len(indices))
+                             for b in range(a + 1, len(indices)))
+            elif num < complement and complement in self.positions:
+                pairs.extend((min(i, j), max(i, j))
+                             for i in indices
+                             for j in self.positions[complement])
+        pairs.sort()
+        return pairs
+    
+    def __str__(self):
+        """String representation of a TwoSumIndex."""
+        return f"TwoSumIndex({len(self.numbers)} numbers, {len(self.positions)} distinct)"
+
+
+def two_sum_sorted(numbers, target):
+    """
+    Find two numbers in a sorted list that add up to the target.
+    
+    Uses two pointers moving inwards, so no hash map is built. NumPy
+    arrays are searched for every complement at once with
+    numpy.searchsorted.
+    
+    Args:
+        numbers (list or numpy.ndarray): Integers sorted in ascending order
+        target (int): Target sum
+    
+    Returns:
+        tuple: Indices (i, j) with i < j, or None if no such pair exists
+    """
+    if numpy is not None and isinstance(numbers, numpy.ndarray):
+        if len(numbers) < 2:
+            return None
+        # For each i, the complement is searched after position i only
+        positions = numpy.searchsorted(numbers, target - numbers)
+        positions = numpy.maximum(positions, numpy.arange(1, len(numbers) + 1))
+        clipped = numpy.minimum(positions, len(numbers) - 1)
+        hits = numpy.nonzero((positions < len(numbers)) & (numbers[clipped] + numbers == target))[0]
+        if not len(hits):
+            return None
+        i = int(hits[0])
+        return (i, int(positions[i]))
+    
+    left, right = 0, len(numbers) - 1
+    while left < right:
+        total = numbers[left] + numbers[right]
+        if total == target:
+            return (left, right)
+        elif total < target:
+            left += 1
+        else:
+            right -= 1
+    
+    return None
+
+
+def k_sum(numbers, target, k=3):
+    """
+    Find every distinct combination of k numbers that add up to the target.
+    
+    The numbers are sorted once; each level fixes one number and the last
+    two numbers are found with two pointers, giving O(n^(k-1)) time.
+    
+    Args:
+        numbers (list): List of integers
+        target (int): Target sum
+        k (int): Number of terms (at least 2)
+    
+    Returns:
+        list: Sorted list of value tuples in ascending order, without duplicates
+    """
+    if k < 2:
+        raise ValueError("k must be at least 2")
+    
+    results = []
+    _k_sum(sorted(numbers), target, k, 0, (), results)
+    return results
+
+
+def _k_sum(values, target, k, start, prefix, results):
+    """
+    Collect k-sum combinations from values[start:] extending a prefix.
+    
+    Args:
+        values (list): Sorted integers
+        target (int): Remaining target sum
+        k (int): Number of terms still to choose
+        start (int): First index that may be chosen
+        prefix (tuple): Values chosen so far
+        results (list): List the combinations are appended to
+    """
+    n = len(values)
+    if n - start < k:
+        return
+    
+    if k == 2:
+        left, right = start, n - 1
+        while left < right:
+            total = values[left] + values[right]
+            if total < target:
+                left += 1
+            elif total > target:
+                right -= 1
+            else:
+                results.append(prefix + (values[left], values[right]))
+                # Skip duplicates of the pair just found
+                left += 1
+                while left < right and values[left] == values[left - 1]:
+                    left += 1
+                right -= 1
+        return
+    
+    for i in range(start, n - k + 1):
+        if i > start and values[i] == values[i - 1]:
+            continue
+        # Stop once even the smallest remaining choices overshoot the target
+        if values[i] * k > target:
+            break
+        _k_sum(values, target - values[i], k - 1, i + 1, prefix + (values[i],), results)
+
+
+def stream_two_sum(numbers, target, window):
+    """
+    Find pairs adding up to the target within a sliding window of a stream.
+    
+    Only the last `window` items are kept, so memory stays bounded for
+    unbounded iterators.
+    
+    Args:
+        numbers (iterable): Stream of integers
+        target (int): Target sum
+        window (int): Maximum distance between the two indices of a pair
+    
+    Yields:
+        tuple: Stream indices (i, j) with i < j and j - i <= window
+    """
+    if window < 1:
+        raise ValueError("Window must be at least 1")
+    
+    recent = deque()
+    positions = {}
+    
+    for j, num in enumerate(numbers):
+        for i in positions.get(target - num, ()):
+            yield (i, j)
+        
+        recent.append((j, num))
+        positions.setdefault(num, deque()).append(j)
+        
+        # Evict the item that just fell out of the window
+        if len(recent) > window:
+            _, old = recent.popleft()
+            indices = positions[old]
+            indices.popleft()
+            if not indices:
+                del positions[old]
+
+
 def find_max_subarray_sum(array):
     """
     Find the maximum sum of a contiguous subarray using Kadane's algorithm.
@@ -56,10 +301,405 @@ def find_max_subarray_sum(array):
     return max_so_far
 
 
+def max_subarray(array, workers=None):
+    """
+    Find the maximum-sum contiguous subarray and where it lies.
+    
+    Args:
+        array (list or numpy.ndarray): Non-empty list of numbers
+        workers (int): Number of processes to summarize chunks in parallel
+                       (default None runs in the current process)
+    
+    Returns:
+        tuple: (sum, start, end) with start and end inclusive
+    """
+    if not len(array):
+        raise ValueError("Array must not be empty")
+    
+    if workers and workers > 1 and len(array) >= workers * _PARALLEL_MIN_CHUNK:
+        chunk_size = -(-len(array) // workers)
+        chunks = [array[i:i + chunk_size] for i in range(0, len(array), chunk_size)]
+        summary = summarize_chunks(chunks, workers)
+    else:
+        summary = summarize_subarray(array)
+    
+    return summary.best
+
+
+class SubarraySummary:
+    """Mergeable Kadane summary of a contiguous chunk of numbers."""
+    
+    __slots__ = ("length", "total", "prefix", "suffix", "best")
+    
+    def __init__(self, length, total, prefix, suffix, best):
+        """
+        Initialize a new SubarraySummary.
+        
+        Indices are relative to the start of the chunk and inclusive.
+        
+        Args:
+            length (int): Number of elements in the chunk
+            total (number): Sum of the chunk
+            prefix (tuple): (sum, end) of the best non-empty prefix
+            suffix (tuple): (sum, start) of the best non-empty suffix
+            best (tuple): (sum, start, end) of the best non-empty subarray
+        """
+        self.length = length
+        self.total = total
+        self.prefix = prefix
+        self.suffix = suffix
+        self.best = best
+    
+    def combine(self, other):
+        """
+        Summarize this chunk followed directly by another chunk.
+        
+        Args:
+            other (SubarraySummary): Summary of the chunk that comes next
+        
+        Returns:
+            SubarraySummary: Exact summary of the concatenated chunks
+        """
+        if not self.length:
+            return other
+        if not other.length:
+            return self
+        
+        offset = self.length
+        
+        prefix = self.prefix
+        if self.total + other.prefix[0] > prefix[0]:
+            prefix = (self.total + other.prefix[0], other.prefix[1] + offset)
+        
+        suffix = (other.suffix[0], other.suffix[1] + offset)
+        if other.total + self.suffix[0] > suffix[0]:
+            suffix = (other.total + self.suffix[0], self.suffix[1])
+        
+        # The best subarray is inside one chunk or spans the boundary
+        best = self.best
+        if other.best[0] > best[0]:
+            best = (other.best[0], other.best[1] + offset, other.best[2] + offset)
+        if self.suffix[0] + other.prefix[0] > best[0]:
+            best = (self.suffix[0] + other.prefix[0], self.suffix[1], other.prefix[1] + offset)
+        
+        return SubarraySummary(self.length + other.length, self.total + other.total,
+                               prefix, suffix, best)
+    
+    def __str__(self):
+        """String representation of a SubarraySummary."""
+        return f"SubarraySummary(length={self.length}, total={self.total}, best={self.best})"
+
+
+# Summary of an empty chunk, the identity for SubarraySummary.combine
+EMPTY_SUMMARY = SubarraySummary(0, 0, None, None, None)
+
+
+def summarize_subarray(array):
+    """
+    Build the Kadane summary of one chunk in a single pass.
+    
+    NumPy arrays are summarized with vectorized prefix sums.
+    
+    Args:
+        array (list or numpy.ndarray): Chunk of numbers
+    
+    Returns:
+        SubarraySummary: Summary of the chunk
+    """
+    n = len(array)
+    if not n:
+        return EMPTY_SUMMARY
+    
+    if numpy is not None and isinstance(array, numpy.ndarray):
+        return _summarize_numpy(array)
+    
+    first = array[0]
+    best, best_start, best_end = first, 0, 0
+    current, current_start = first, 0
+    total = first
+    prefix, prefix_end = first, 0
+    min_before, min_before_index = 0, 0
+    
+    for i in range(1, n):
+        x = array[i]
+        
+        # Track the smallest running sum before i for the best suffix
+        if total < min_before:
+            min_before, min_before_index = total, i
+        
+        if current < 0:
+            current, current_start = x, i
+        else:
+            current += x
+        if current > best:
+            best, best_start, best_end = current, current_start, i
+        
+        total += x
+        if total > prefix:
+            prefix, prefix_end = total, i
+    
+    return SubarraySummary(n, total, (prefix, prefix_end),
+                           (total - min_before, min_before_index),
+                           (best, best_start, best_end))
+
+
+def _summarize_numpy(array):
+    """
+    Vectorized summarize_subarray for NumPy arrays.
+    
+    Args:
+        array (numpy.ndarray): Non-empty chunk of numbers
+    
+    Returns:
+        SubarraySummary: Summary of the chunk
+    """
+    sums = numpy.concatenate(([0], numpy.cumsum(array)))
+    before = sums[:-1]
+    total = sums[-1].item()
+    
+    # The best subarray ending at j starts after the smallest sum before it
+    running_min = numpy.minimum.accumulate(before)
+    best_end = int(numpy.argmax(sums[1:] - running_min))
+    best_start = int(numpy.argmin(before[:best_end + 1]))
+    best = (sums[best_end + 1] - sums[best_start]).item()
+    
+    prefix_end = int(numpy.argmax(sums[1:]))
+    suffix_start = int(numpy.argmin(before))
+    
+    return SubarraySummary(len(array), total,
+                           (sums[prefix_end + 1].item(), prefix_end),
+                           (total - before[suffix_start].item(), suffix_start),
+                           (best, best_start, best_end))
+
+
+def summarize_chunks(chunks, workers=None):
+    """
+    Combine the summaries of consecutive chunks of one sequence.
+    
+    Chunks can be slices of a large array, blocks read from a file or
+    batches arriving from a stream; the result is exact either way.
+    
+    Args:
+        chunks (iterable): Consecutive chunks in order
+        workers (int): Number of processes to summarize chunks in parallel
+                       (default None runs in the current process)
+    
+    Returns:
+        SubarraySummary: Summary of all chunks joined together
+    """
+    if workers and workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            summaries = list(pool.map(summarize_subarray, chunks))
+    else:
+        summaries = map(summarize_subarray, chunks)
+    
+    summary = EMPTY_SUMMARY
+    for chunk_summary in summaries:
+        summary = summary.combine(chunk_summary)
+    return summary
+
+
+class SegmentTree:
+    """Segment tree for range max-subarray, sum and max queries with point updates."""
+    
+    def __init__(self, array):
+        """
+        Initialize a new SegmentTree.
+        
+        Nodes live in flat lists indexed heap-style (node i has children
+        2i and 2i + 1, leaves start at index size), one list per field
+        of the Kadane summary, instead of one object per node.
+        
+        Args:
+            array (list): Non-empty list of numbers
+        """
+        if not array:
+            raise ValueError("Array must not be empty")
+        
+        self.length = len(array)
+        self.size = 1
+        while self.size < self.length:
+            self.size *= 2
+        
+        # Padding leaves hold the identity of _combine_kadane
+        nodes = 2 * self.size
+        self.total = [0] * nodes
+        self.prefix = [_NEG_INF] * nodes
+        self.suffix = [_NEG_INF] * nodes
+        self.best = [_NEG_INF] * nodes
+        self.maximum = [_NEG_INF] * nodes
+        
+        for i, value in enumerate(array):
+            leaf = self.size + i
+            self.total[leaf] = self.prefix[leaf] = self.suffix[leaf] = value
+            self.best[leaf] = self.maximum[leaf] = value
+        for node in range(self.size - 1, 0, -1):
+            self._pull(node)
+    
+    def __len__(self):
+        """Number of elements in the tree."""
+        return self.length
+    
+    def __getitem__(self, index):
+        """Element at index."""
+        return self.total[self.size + self._check_index(index)]
+    
+    def update(self, index, value):
+        """
+        Replace one element and refresh its ancestors in O(log n).
+        
+        Args:
+            index (int): Position of the element
+            value (number): New value
+        """
+        node = self.size + self._check_index(index)
+        self.total[node] = self.prefix[node] = self.suffix[node] = value
+        self.best[node] = self.maximum[node] = value
+        node //= 2
+        while node:
+            self._pull(node)
+            node //= 2
+    
+    def range_max_subarray(self, left, right):
+        """
+        Find the maximum sum of a contiguous subarray inside [left, right].
+        
+        Args:
+            left (int): First position (inclusive)
+            right (int): Last position (inclusive)
+        
+        Returns:
+            number: Maximum subarray sum within the range
+        """
+        lo, hi = self._check_range(left, right)
+        left_part = right_part = _KADANE_IDENTITY
+        
+        # Summaries are not commutative, so collect both sides in order
+        while lo < hi:
+            if lo & 1:
+                left_part = _combine_kadane(left_part, self._node(lo))
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                right_part = _combine_kadane(self._node(hi), right_part)
+            lo //= 2
+            hi //= 2
+        
+        return _combine_kadane(left_part, right_part)[3]
+    
+    def range_sum(self, left, right):
+        """
+        Sum the elements inside [left, right].
+        
+        Args:
+            left (int): First position (inclusive)
+            right (int): Last position (inclusive)
+        
+        Returns:
+            number: Sum of the range
+        """
+        lo, hi = self._check_range(left, right)
+        result = 0
+        while lo < hi:
+            if lo & 1:
+                result += self.total[lo]
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                result += self.total[hi]
+            lo //= 2
+            hi //= 2
+        return result
+    
+    def range_max(self, left, right):
+        """
+        Find the largest element inside [left, right].
+        
+        Args:
+            left (int): First position (inclusive)
+            right (int): Last position (inclusive)
+        
+        Returns:
+            number: Largest element of the range
+        """
+        lo, hi = self._check_range(left, right)
+        result = _NEG_INF
+        while lo < hi:
+            if lo & 1:
+                result = max(result, self.maximum[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                result = max(result, self.maximum[hi])
+            lo //= 2
+            hi //= 2
+        return result
+    
+    def _node(self, node):
+        """Kadane summary (total, prefix, suffix, best) of a node."""
+        return (self.total[node], self.prefix[node], self.suffix[node], self.best[node])
+    
+    def _pull(self, node):
+        """Recompute a node from its two children."""
+        left, right = 2 * node, 2 * node + 1
+        (self.total[node], self.prefix[node],
+         self.suffix[node], self.best[node]) = _combine_kadane(self._node(left), self._node(right))
+        self.maximum[node] = max(self.maximum[left], self.maximum[right])
+    
+    def _check_index(self, index):
+        """Validate an element index, allowing negative indexes."""
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("Index out of range")
+        return index
+    
+    def _check_range(self, left, right):
+        """Validate an inclusive range and convert it to half-open leaf positions."""
+        if not 0 <= left <= right < self.length:
+            raise IndexError("Range out of bounds")
+        return left + self.size, right + self.size + 1
+    
+    def __str__(self):
+        """String representation of a SegmentTree."""
+        return f"SegmentTree({self.length} elements)"
+
+
+# Sentinel below every number, used for empty tree nodes
+_NEG_INF = float("-inf")
+
+# (total, prefix, suffix, best) of an empty range
+_KADANE_IDENTITY = (0, _NEG_INF, _NEG_INF, _NEG_INF)
+
+
+def _combine_kadane(left, right):
+    """
+    Combine the Kadane summaries of two adjacent ranges.
+    
+    This is the index-free form of SubarraySummary.combine.
+    
+    Args:
+        left (tuple): (total, prefix, suffix, best) of the left range
+        right (tuple): (total, prefix, suffix, best) of the right range
+    
+    Returns:
+        tuple: (total, prefix, suffix, best) of the joined range
+    """
+    left_total, left_prefix, left_suffix, left_best = left
+    right_total, right_prefix, right_suffix, right_best = right
+    return (left_total + right_total,
+            max(left_prefix, left_total + right_prefix),
+            max(right_suffix, right_total + left_suffix),
+            max(left_best, right_best, left_suffix + right_prefix))
+
+
 def binary_search(array, target):
     """
     Perform binary search on a sorted array.
     
+    Any sequence supporting len() and indexing can be searched, including
+    a MappedRecords view over a sorted binary file on disk.
+    
     Args:
         array (list): Sorted list of elements
         target: Element to find
@@ -71,10 +711,11 @@ def binary_search(array, target):
     
     while left <= right:
         mid = (left + right) // 2
+        value = array[mid]
         
-        if array[mid] == target:
+        if value == target:
             return mid
-        elif array[mid] < target:
+        elif value < target:
             left = mid + 1
         else:
             right = mid - 1
@@ -82,35 +723,306 @@ def binary_search(array, target):
     return -1
 
 
-def merge_sort(array):
+class MappedRecords:
+    """Read-only sequence of the keys in a file of fixed-width binary records."""
+    
+    def __init__(self, path, record_format="<q", key_field=0):
+        """
+        Initialize a new MappedRecords view.
+        
+        The file is memory-mapped rather than read, so opening a large file
+        is instant and only the pages touched by a search are loaded.
+        
+        Args:
+            path (str): Path of the binary file, sorted by the key field
+            record_format (str): struct format of one record, e.g. "<q" for
+                                 int64 keys or "<qq" for key+offset pairs
+            key_field (int): Index of the key within each record
+        """
+        self.record = struct.Struct(record_format)
+        self.key_field = key_field
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size % self.record.size:
+                raise ValueError("File size is not a multiple of the record size")
+            # mmap cannot map empty files
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self.length = size // self.record.size
+    
+    def __len__(self):
+        """Number of records in the file."""
+        return self.length
+    
+    def __getitem__(self, index):
+        """Key of the record at index."""
+        return self.get_record(index)[self.key_field]
+    
+    def get_record(self, index):
+        """
+        Unpack the full record at an index.
+        
+        Args:
+            index (int): Record index (negative indexes count from the end)
+        
+        Returns:
+            tuple: Fields of the record
+        """
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("Record index out of range")
+        return self.record.unpack_from(self.buffer, index * self.record.size)
+    
+    def close(self):
+        """Unmap the file."""
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+    
+    def __enter__(self):
+        """Use the view as a context manager that unmaps the file on exit."""
+        return self
+    
+    def __exit__(self, *exc_info):
+        """Unmap the file when leaving the with block."""
+        self.close()
+    
+    def __str__(self):
+        """String representation of a MappedRecords view."""
+        return f"MappedRecords({self.length} records of {self.record.size} bytes)"
+
+
+class SortedIndex:
+    """Search index built once over a sorted array for many lookups."""
+    
+    def __init__(self, array):
+        """
+        Initialize a new SortedIndex.
+        
+        Lists are indexed by a hash map from each distinct element to the
+        position of its first occurrence, so every lookup is O(1) after the
+        O(n) build. NumPy arrays are kept as-is and searched with
+        numpy.searchsorted instead.
+        
+        Args:
+            array (list or numpy.ndarray): Sorted elements to search
+        """
+        if numpy is not None and isinstance(array, numpy.ndarray):
+            self.array = array
+            self.positions = None
+        else:
+            self.array = list(array)
+            # Walk backwards so the first occurrence of each element wins
+            n = len(self.array)
+            self.positions = dict(zip(reversed(self.array), range(n - 1, -1, -1)))
+    
+    def __len__(self):
+        """Number of elements in the index."""
+        return len(self.array)
+    
+    def __contains__(self, target):
+        """Check whether target is in the index."""
+        return self.find(target) != -1
+    
+    def find(self, target):
+        """
+        Find the index of the first occurrence of a target.
+        
+        Args:
+            target: Element to find
+        
+        Returns:
+            int: Index of the target if found, -1 otherwise
+        """
+        if self.positions is not None:
+            return self.positions.get(target, -1)
+        
+        i = int(numpy.searchsorted(self.array, target))
+        if i < len(self.array) and self.array[i] == target:
+            return i
+        return -1
+    
+    def find_many(self, targets):
+        """
+        Find the index of the first occurrence of each target.
+        
+        Args:
+            targets (iterable): Elements to find
+        
+        Returns:
+            list or numpy.ndarray: Index of each target (in the order given)
+                                   if found, -1 otherwise
+        """
+        if self.positions is None:
+            return self._find_many_numpy(targets)
+        
+        get = self.positions.get
+        return [get(target, -1) for target in targets]
+    
+    def _find_many_numpy(self, targets):
+        """
+        Vectorized find_many for NumPy-backed indexes.
+        
+        Args:
+            targets (iterable): Elements to find
+        
+        Returns:
+            numpy.ndarray: Index of each target if found, -1 otherwise
+        """
+        targets = numpy.asarray(targets)
+        positions = numpy.searchsorted(self.array, targets)
+        if not len(self.array):
+            return numpy.full(positions.shape, -1, dtype=numpy.intp)
+        
+        clipped = numpy.minimum(positions, len(self.array) - 1)
+        found = self.array[clipped] == targets
+        return numpy.where(found, positions, -1)
+    
+    def __str__(self):
+        """String representation of a SortedIndex."""
+        return f"SortedIndex({len(self)} elements)"
+
+
+def merge_sort(array, key=None, workers=None):
     """
-    Sort an array using the merge sort algorithm.
+    Sort an array using a bottom-up (iterative) merge sort.
+    
+    Short runs are insertion-sorted in place, then merged pairwise with
+    doubling widths, ping-ponging between the working list and a single
+    scratch buffer of the same size. No sublists are sliced off and there
+    is no recursion, so large inputs do not hit the recursion limit.
+    The sort is stable.
     
     Args:
         array (list): List to sort
+        key (function): Optional function computing each item's sort key.
+                        Must be picklable (a module-level function) when
+                        workers is used.
+        workers (int): Number of processes to sort chunks in parallel
+                       (default None sorts in the current process)
         
     Returns:
         list: Sorted list
     """
-    if len(array) <= 1:
-        return array
-        
-    # Split the array into two halves
-    mid = len(array) // 2
-    left = merge_sort(array[:mid])
-    right = merge_sort(array[mid:])
+    if workers and workers > 1 and len(array) >= workers * _PARALLEL_MIN_CHUNK:
+        return _parallel_merge_sort(array, key, workers)
+    
+    if key is None:
+        return _bottom_up_sort(list(array))
     
-    # Merge the sorted halves
-    return merge(left, right)
+    # Decorate with (key, index) so ties fall back to the original order
+    decorated = _bottom_up_sort([(key(item), i) for i, item in enumerate(array)])
+    return [array[i] for _, i in decorated]
+
+
+# Length of the runs insertion-sorted before the merge passes start
+_RUN_LENGTH = 32
 
+# Smallest chunk worth shipping to a worker process
+_PARALLEL_MIN_CHUNK = 10000
 
-def merge(left, right):
+
+def _bottom_up_sort(buffer):
+    """
+    Sort a list with a bottom-up merge sort using one scratch buffer.
+    
+    Args:
+        buffer (list): List to sort; it is reused as one of the two buffers
+    
+    Returns:
+        list: Sorted list (either buffer or the scratch buffer)
+    """
+    n = len(buffer)
+    if n <= 1:
+        return buffer
+    
+    # Insertion-sort short runs in place
+    for lo in range(0, n, _RUN_LENGTH):
+        hi = min(lo + _RUN_LENGTH, n)
+        for i in range(lo + 1, hi):
+            item = buffer[i]
+            j = i - 1
+            while j >= lo and item < buffer[j]:
+                buffer[j + 1] = buffer[j]
+                j -= 1
+            buffer[j + 1] = item
+    
+    # Merge runs of doubling width back and forth between the two buffers
+    src, dst = buffer, [None] * n
+    width = _RUN_LENGTH
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            _merge_runs(src, dst, lo, mid, hi)
+        src, dst = dst, src
+        width *= 2
+    
+    return src
+
+
+def _merge_runs(src, dst, lo, mid, hi):
+    """
+    Merge the sorted runs src[lo:mid] and src[mid:hi] into dst[lo:hi].
+    
+    Args:
+        src (list): Buffer holding the two sorted runs
+        dst (list): Buffer receiving the merged run
+        lo (int): Start of the first run
+        mid (int): End of the first run and start of the second
+        hi (int): End of the second run
+    """
+    i, j, k = lo, mid, lo
+    
+    # Runs already in order only need to be copied across
+    if mid == hi or not src[mid] < src[mid - 1]:
+        dst[lo:hi] = src[lo:hi]
+        return
+    
+    while i < mid and j < hi:
+        if src[j] < src[i]:
+            dst[k] = src[j]
+            j += 1
+        else:
+            dst[k] = src[i]
+            i += 1
+        k += 1
+    
+    # Copy whichever run still has elements left
+    if i < mid:
+        dst[k:hi] = src[i:mid]
+    else:
+        dst[k:hi] = src[j:hi]
+
+
+def _parallel_merge_sort(array, key, workers):
+    """
+    Sort chunks of an array in a process pool and merge the sorted chunks.
+    
+    Args:
+        array (list): List to sort
+        key (function): Optional picklable key function
+        workers (int): Number of worker processes
+    
+    Returns:
+        list: Sorted list
+    """
+    chunk_size = -(-len(array) // workers)
+    chunks = [array[i:i + chunk_size] for i in range(0, len(array), chunk_size)]
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        runs = list(pool.map(merge_sort, chunks, [key] * len(chunks)))
+    
+    return list(merge_many(*runs, key=key))
+
+
+def merge(left, right, key=None):
     """
     Merge two sorted arrays.
     
     Args:
         left (list): First sorted list
         right (list): Second sorted list
+        key (function): Optional function computing each item's sort key
         
     Returns:
         list: Merged sorted list
@@ -118,9 +1030,15 @@ def merge(left, right):
     result = []
     i = j = 0
     
+    if key is None:
+        left_keys, right_keys = left, right
+    else:
+        left_keys = [key(item) for item in left]
+        right_keys = [key(item) for item in right]
+    
     # Compare elements from both lists and add the smaller one to the result
     while i < len(left) and j < len(right):
-        if left[i] <= right[j]:
+        if left_keys[i] <= right_keys[j]:
             result.append(left[i])
             i += 1
         else:
@@ -134,6 +1052,337 @@ def merge(left, right):
     return result
 
 
+def merge_many(*iterables, key=None):
+    """
+    Lazily merge any number of sorted iterables.
+    
+    Only the current head of each input is held in a heap, so memory use
+    is proportional to the number of inputs rather than their length.
+    Equal items are yielded in the order of the inputs they came from.
+    
+    Args:
+        *iterables: Sorted iterables to merge
+        key (function): Optional function computing each item's sort key
+    
+    Yields:
+        Items of all iterables in sorted order
+    """
+    heap = []
+    for order, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        for item in iterator:
+            heap.append([item if key is None else key(item), order, item, iterator])
+            break
+    heapq.heapify(heap)
+    
+    # Replace the smallest head with the next item from the same input
+    while len(heap) > 1:
+        entry = heap[0]
+        yield entry[2]
+        item = next(entry[3], _EXHAUSTED)
+        if item is _EXHAUSTED:
+            heapq.heappop(heap)
+        else:
+            entry[0] = item if key is None else key(item)
+            entry[2] = item
+            heapq.heapreplace(heap, entry)
+    
+    # The last input left can be passed through directly
+    if heap:
+        yield heap[0][2]
+        yield from heap[0][3]
+
+
+# Sentinel marking an exhausted input in merge_many
+_EXHAUSTED = object()
+
+
+def external_merge_sort(input_path, output_path, record_format=None,
+                        memory_limit=64 * 1024 * 1024, key=None, spill_dir=None):
+    """
+    Sort a file of numeric records that may not fit in memory.
+    
+    The input is read in runs whose estimated in-memory size (the record
+    objects plus the list slots, keys and decorated tuples merge_sort
+    builds) stays within memory_limit. Each run is sorted with merge_sort
+    and spilled to a temporary file. The runs are then streamed back
+    through k-way merges of at most MAX_MERGE_FAN_IN runs at a time, with
+    the budget split between the open readers and the writer, taking
+    several passes when there are more runs than that.
+    
+    Two record layouts are supported:
+    - Newline-delimited text (record_format=None), one number per line.
+      Lines are ordered by their numeric value and written back unchanged.
+    - Fixed-width binary records described by a struct format string,
+      e.g. "<q" for int64 keys or "<qq" for key+offset pairs. Multi-field
+      records are ordered field by field.
+    
+    Args:
+        input_path (str): Path of the file to sort
+        output_path (str): Path the sorted file is written to
+        record_format (str): struct format of binary records, or None for text
+        memory_limit (int): Approximate number of bytes of Python objects
+                            held in memory at once
+        key (function): Optional sort key; defaults to the numeric value of
+                        text lines and to the record itself for binary files
+        spill_dir (str): Directory for the sorted runs (default: system
+                         temp, which may be held in memory on tmpfs hosts)
+    
+    Returns:
+        int: Number of records sorted
+    """
+    if memory_limit <= 0:
+        raise ValueError("Memory limit must be positive")
+    
+    # Enough readers to keep each one's buffer at least _MIN_READER_BYTES
+    fan_in = max(2, min(MAX_MERGE_FAN_IN, memory_limit // _MIN_READER_BYTES))
+    io_bytes = max(memory_limit // (fan_in + 1), _MIN_IO_BYTES)
+    
+    if record_format is None:
+        key = key or _parse_number
+        read_runs = _read_text_runs(input_path, memory_limit - io_bytes)
+        write_run = functools.partial(_write_text_run, buffering=io_bytes)
+        read_run = functools.partial(_read_text_run, buffering=io_bytes)
+    else:
+        record = struct.Struct(record_format)
+        overhead = _KEYED_OVERHEAD if key else _PLAIN_OVERHEAD
+        read_runs = _read_binary_runs(input_path, record, memory_limit - io_bytes, overhead)
+        write_run = functools.partial(_write_binary_run, record=record, buffering=io_bytes)
+        read_run = functools.partial(_read_binary_run, record=record, block_bytes=io_bytes)
+    
+    count = 0
+    with tempfile.TemporaryDirectory(prefix="merge_sort_", dir=spill_dir) as run_dir:
+        run_paths = []
+        for items in read_runs:
+            path = os.path.join(run_dir, f"run{len(run_paths)}")
+            count += len(items)
+            items = merge_sort(items, key=key)
+            write_run(path, items)
+            del items
+            run_paths.append(path)
+        
+        # Merge fan_in runs at a time until one pass can finish the job
+        passes = 0
+        while len(run_paths) > fan_in:
+            merged = []
+            for start in range(0, len(run_paths), fan_in):
+                group = run_paths[start:start + fan_in]
+                path = os.path.join(run_dir, f"pass{passes}_{len(merged)}")
+                write_run(path, merge_many(*map(read_run, group), key=key))
+                for done in group:
+                    os.remove(done)
+                merged.append(path)
+            run_paths = merged
+            passes += 1
+        
+        write_run(output_path, merge_many(*map(read_run, run_paths), key=key))
+    
+    return count
+
+
+# Size of the blocks used when streaming runs to and from disk
+_IO_BLOCK_SIZE = 1024 * 1024
+
+# Largest number of runs merged (and files open) at once
+MAX_MERGE_FAN_IN = 64
+
+# Smallest share of the memory limit given to one open run reader
+_MIN_READER_BYTES = 64 * 1024
+
+# Floor on the size of file buffers and read blocks
+_MIN_IO_BYTES = 4096
+
+# Estimated bytes per record besides the record itself: the run list,
+# merge_sort's copy and scratch buffer, and with a key also the decorated
+# list, the (key, index) tuple, the key, the index and the output list
+_PLAIN_OVERHEAD = 3 * 8
+_KEYED_OVERHEAD = 5 * 8 + 56 + 32 + 32
+
+# Upper bound on the size of one boxed int or float field
+_BOXED_FIELD_BYTES = 40
+
+
+def _parse_number(line):
+    """
+    Parse a text record as an int, falling back to float.
+    
+    Args:
+        line (str): Text record
+    
+    Returns:
+        int or float: Numeric value of the record
+    """
+    try:
+        return int(line)
+    except ValueError:
+        return float(line)
+
+
+def _read_text_runs(path, memory_limit):
+    """
+    Read a newline-delimited file in runs of about memory_limit bytes.
+    
+    Each line is counted as the size of its str object plus the per-record
+    overhead of a keyed merge_sort.
+    
+    Args:
+        path (str): Path of the text file
+        memory_limit (int): Estimated in-memory bytes per run
+    
+    Yields:
+        list: Non-empty lines of the run, without their line endings
+    """
+    sizeof = sys.getsizeof
+    with open(path, "r") as file:
+        run, size = [], 0
+        for line in file:
+            line = line.rstrip("\r\n")
+            if not line.strip():
+                continue
+            run.append(line)
+            size += sizeof(line) + _KEYED_OVERHEAD
+            if size >= memory_limit:
+                yield run
+                run, size = [], 0
+        if run:
+            yield run
+
+
+def _write_text_run(path, lines, buffering=_IO_BLOCK_SIZE):
+    """
+    Write lines to a text file in large buffered blocks.
+    
+    Args:
+        path (str): Path of the file to write
+        lines (iterable): Lines without line endings
+        buffering (int): Size of the file buffer in bytes
+    """
+    with open(path, "w", buffering=buffering) as file:
+        file.writelines(line + "\n" for line in lines)
+
+
+def _read_text_run(path, buffering=_IO_BLOCK_SIZE):
+    """
+    Stream the lines of a run file.
+    
+    Args:
+        path (str): Path of the run file
+        buffering (int): Size of the file buffer in bytes
+    
+    Yields:
+        str: Lines without their line endings
+    """
+    with open(path, "r", buffering=buffering) as file:
+        for line in file:
+            yield line.rstrip("\n")
+
+
+def _unpack_block(record, block):
+    """
+    Unpack a block of fixed-width records.
+    
+    Args:
+        record (struct.Struct): Record layout
+        block (bytes): Whole number of packed records
+    
+    Returns:
+        list: Scalars for single-field records, tuples otherwise
+    """
+    if len(record.unpack(bytes(record.size))) == 1:
+        return [fields[0] for fields in record.iter_unpack(block)]
+    return list(record.iter_unpack(block))
+
+
+def _record_object_bytes(record):
+    """
+    Estimate the in-memory size of one unpacked record.
+    
+    Args:
+        record (struct.Struct): Record layout
+    
+    Returns:
+        int: Bytes for the boxed fields, plus the tuple for multi-field records
+    """
+    fields = len(record.unpack(bytes(record.size)))
+    size = _BOXED_FIELD_BYTES * fields
+    if fields > 1:
+        size += sys.getsizeof((0,) * fields)
+    return size
+
+
+def _read_binary_runs(path, record, memory_limit, overhead):
+    """
+    Read a fixed-width binary file in runs of about memory_limit bytes.
+    
+    Each record is counted as its packed bytes, its unpacked objects and
+    overhead bytes of sorting structures.
+    
+    Args:
+        path (str): Path of the binary file
+        record (struct.Struct): Record layout
+        memory_limit (int): Estimated in-memory bytes per run
+        overhead (int): Estimated sorting overhead per record in bytes
+    
+    Yields:
+        list: Records of the run
+    """
+    per_record = record.size + _record_object_bytes(record) + overhead
+    run_bytes = max(memory_limit // per_record, 1) * record.size
+    with open(path, "rb") as file:
+        while True:
+            block = file.read(run_bytes)
+            if not block:
+                break
+            if len(block) % record.size:
+                raise ValueError("File size is not a multiple of the record size")
+            yield _unpack_block(record, block)
+
+
+def _write_binary_run(path, items, record, buffering=_IO_BLOCK_SIZE):
+    """
+    Pack records into a binary file in large buffered blocks.
+    
+    Args:
+        path (str): Path of the file to write
+        items (iterable): Scalars or tuples matching the record layout
+        record (struct.Struct): Record layout
+        buffering (int): Size of the file buffer in bytes
+    """
+    single = len(record.unpack(bytes(record.size))) == 1
+    pack = record.pack
+    with open(path, "wb", buffering=buffering) as file:
+        if single:
+            file.writelines(pack(item) for item in items)
+        else:
+            file.writelines(pack(*item) for item in items)
+
+
+def _read_binary_run(path, record, block_bytes=_IO_BLOCK_SIZE):
+    """
+    Stream the records of a binary run file block by block.
+    
+    Each block holds about block_bytes of unpacked records, so a merge
+    with several open runs stays within its share of the memory limit.
+    
+    Args:
+        path (str): Path of the run file
+        record (struct.Struct): Record layout
+        block_bytes (int): Estimated in-memory bytes of each unpacked block
+    
+    Yields:
+        Scalars for single-field records, tuples otherwise
+    """
+    per_record = record.size + _record_object_bytes(record) + 8
+    block_records = max(block_bytes // per_record, 1)
+    with open(path, "rb", buffering=0) as file:
+        while True:
+            block = file.read(block_records * record.size)
+            if not block:
+                break
+            yield from _unpack_block(record, block)
+            del block
+
+
 if __name__ == "__main__":
     # Demo two_sum
     numbers = [2, 7, 11, 15]
@@ -141,9 +1390,15 @@ if __name__ == "__main__":
     result = two_sum(numbers, target)
     print(f"Two Sum: In {numbers}, indices {result} add up to {target}")
     
+    # Demo batched and k-sum queries
+    index = TwoSumIndex(numbers)
+    print(f"Two Sum batch: targets [9, 18, 100] → {index.find_many([9, 18, 100])}")
+    print(f"Three Sum: {k_sum([-1, 0, 1, 2, -1, -4], 0, k=3)}")
+    
     # Demo max subarray sum
     array = [-2, 1, -3, 4, -1, 2, 1, -5, 4]
     print(f"Max subarray sum in {array}: {find_max_subarray_sum(array)}")
+    print(f"Max subarray (sum, start, end): {max_subarray(array)}")
     
     # Demo binary search
     sorted_array = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
@@ -151,6 +1406,10 @@ if __name__ == "__main__":
     index = binary_search(sorted_array, target)
     print(f"Binary search: {target} found at index {index} in {sorted_array}")
     
+    # Demo bulk lookups through a SortedIndex
+    index = SortedIndex(sorted_array)
+    print(f"Bulk search: {[3, 11, 7]} found at {index.find_many([3, 11, 7])}")
+    
     # Demo merge sort
     unsorted = [38, 27, 43, 3, 9, 82, 10]
     sorted_array = merge_sort(unsorted)
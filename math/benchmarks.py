@@ -0,0 +1,493 @@
+"""
+Benchmarks Module - Timing utilities for the algorithms in this package.
+
+This module provides benchmarks including:
+- Lazy k-way merge_many against repeated pairwise merge calls
+- TwoSumIndex.find_many against calling two_sum once per target
+- A regression suite for two_sum, binary_search, merge_sort, merge and
+  find_max_subarray_sum with JSON baselines
+- Matrix multiplication backends and their crossover sizes
+
+Run the suite from the math directory, for example:
+    python benchmarks.py --sizes 1000 100000 --save baseline.json
+    python benchmarks.py --sizes 1000 100000 --compare baseline.json
+"""
+
+import argparse
+import functools
+import json
+import platform
+import random
+import time
+import tracemalloc
+
+from algorithms import (TwoSumIndex, binary_search, find_max_subarray_sum, merge,
+                        merge_many, merge_sort, two_sum)
+from matrix import create_random_matrix, multiply_matrices, numpy
+
+# Input orderings covered by the regression suite
+INPUT_KINDS = ("random", "sorted", "reversed", "duplicates")
+
+# Input sizes used when none are given
+DEFAULT_SIZES = (1000, 10000, 100000)
+
+# Number of lookups timed per binary_search benchmark
+SEARCH_QUERIES = 1000
+
+
+def measure(func, *args, **kwargs):
+    """
+    Measure the wall time and peak memory of a function call.
+    
+    The function is timed on its own and then run a second time under
+    tracemalloc, so the tracing overhead does not skew the timing.
+    
+    Args:
+        func (function): Function to run
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+    
+    Returns:
+        tuple: (seconds elapsed, peak bytes allocated)
+    """
+    call = functools.partial(func, *args, **kwargs)
+    return _time_call(call), _peak_memory(call)
+
+
+def sorted_shards(count, size, seed=0):
+    """
+    Create sorted lists of random integers, like the outputs of sorted shards.
+    
+    Args:
+        count (int): Number of shards
+        size (int): Number of items per shard
+        seed (int): Seed for the random generator
+    
+    Returns:
+        list: List of sorted lists
+    """
+    rng = random.Random(seed)
+    return [sorted(rng.randrange(count * size) for _ in range(size)) for _ in range(count)]
+
+
+def benchmark_merge_many(shard_counts=(2, 8, 32, 128), total=100000, seed=0):
+    """
+    Compare merge_many with folding the shards together using merge.
+    
+    Args:
+        shard_counts (tuple): Numbers of shards to merge
+        total (int): Total number of items across all shards
+        seed (int): Seed for the random generator
+    
+    Returns:
+        list: One dict per shard count with the timings and peak memory
+    """
+    results = []
+    for count in shard_counts:
+        shards = sorted_shards(count, total // count, seed)
+        
+        # Consume merge_many without materializing its output
+        lazy_time, lazy_peak = measure(lambda: sum(1 for _ in merge_many(*shards)))
+        pairwise_time, pairwise_peak = measure(functools.reduce, merge, shards)
+        
+        results.append({
+            "shards": count,
+            "merge_many_seconds": lazy_time,
+            "merge_many_peak_bytes": lazy_peak,
+            "pairwise_seconds": pairwise_time,
+            "pairwise_peak_bytes": pairwise_peak,
+        })
+    return results
+
+
+def print_merge_many():
+    """Print the merge_many comparison."""
+    print("merge_many vs repeated pairwise merge:")
+    for row in benchmark_merge_many():
+        print(f"{row['shards']:>4} shards: "
+              f"merge_many {row['merge_many_seconds']:.3f}s "
+              f"({row['merge_many_peak_bytes'] / 1024:.0f} KiB peak), "
+              f"pairwise {row['pairwise_seconds']:.3f}s "
+              f"({row['pairwise_peak_bytes'] / 1024:.0f} KiB peak)")
+
+
+def benchmark_two_sum_index(size=100000, queries=100, seed=0):
+    """
+    Compare TwoSumIndex.find_many with calling two_sum once per target.
+    
+    Half of the targets have a pair and half do not, so both the early
+    exit and the full scan are covered.
+    
+    Args:
+        size (int): Number of values
+        queries (int): Number of targets
+        seed (int): Seed for the random generator
+    
+    Returns:
+        dict: Seconds for building the index, find_many and the two_sum loop
+    """
+    rng = random.Random(seed)
+    numbers = [rng.randrange(10 ** 9) for _ in range(size)]
+    targets = [numbers[rng.randrange(size)] + numbers[rng.randrange(size)]
+               for _ in range(queries // 2)]
+    targets += [-1 - k for k in range(queries - len(targets))]
+    
+    index = TwoSumIndex(numbers)
+    return {
+        "build_seconds": _time_call(functools.partial(TwoSumIndex, numbers)),
+        "find_many_seconds": _time_call(functools.partial(index.find_many, targets)),
+        "two_sum_seconds": _time_call(lambda: [two_sum(numbers, target) for target in targets]),
+    }
+
+
+def print_two_sum_index():
+    """Print the TwoSumIndex comparison."""
+    row = benchmark_two_sum_index()
+    print("TwoSumIndex.find_many vs a two_sum loop:")
+    print(f"index build {row['build_seconds']:.3f}s, "
+          f"find_many {row['find_many_seconds']:.3f}s, "
+          f"two_sum loop {row['two_sum_seconds']:.3f}s")
+
+
+def _textbook_multiply(matrix1, matrix2):
+    """
+    Multiply two matrices with the i-j-k loop, as a reference point.
+    
+    Args:
+        matrix1 (list): First matrix
+        matrix2 (list): Second matrix
+    
+    Returns:
+        list: Result of matrix multiplication
+    """
+    result = [[0] * len(matrix2[0]) for _ in matrix1]
+    for i in range(len(matrix1)):
+        for j in range(len(matrix2[0])):
+            for k in range(len(matrix2)):
+                result[i][j] += matrix1[i][k] * matrix2[k][j]
+    return result
+
+
+def benchmark_matrix_multiply(sizes=(8, 16, 32, 64, 128, 256), textbook_limit=128, seed=0):
+    """
+    Time square matrix products on each multiplication backend.
+    
+    Args:
+        sizes (tuple): Matrix sizes n for n x n products
+        textbook_limit (int): Largest size timed with the textbook loop
+        seed (int): Seed for the random generator
+    
+    Returns:
+        list: One dict per size with seconds for "textbook", "python" and
+              "numpy" (None when skipped or NumPy is not installed)
+    """
+    rng = random.Random(seed)
+    results = []
+    for n in sizes:
+        first = create_random_matrix(n, n, seed=rng)
+        second = create_random_matrix(n, n, seed=rng)
+        repeat = max(1, 3 * 64 // n)
+        
+        def best(func, *args, **kwargs):
+            return min(_time_call(functools.partial(func, *args, **kwargs)) for _ in range(repeat))
+        
+        results.append({
+            "size": n,
+            "textbook": best(_textbook_multiply, first, second) if n <= textbook_limit else None,
+            "python": best(multiply_matrices, first, second, backend="python"),
+            "numpy": best(multiply_matrices, first, second, backend="numpy") if numpy else None,
+        })
+    return results
+
+
+def find_crossover(results, faster, slower):
+    """
+    Find the smallest size from which one backend stays faster than another.
+    
+    Args:
+        results (list): Output of benchmark_matrix_multiply
+        faster (str): Backend expected to win at large sizes
+        slower (str): Backend it is compared against
+    
+    Returns:
+        int: Crossover size, or None if it never wins or was not measured
+    """
+    crossover = None
+    for row in results:
+        if row[faster] is None or row[slower] is None:
+            continue
+        if row[faster] < row[slower]:
+            if crossover is None:
+                crossover = row["size"]
+        else:
+            crossover = None
+    return crossover
+
+
+def print_matrix_multiply():
+    """Print the matrix multiplication comparison and crossover sizes."""
+    results = benchmark_matrix_multiply()
+    print(f"{'size':>6} {'textbook':>10} {'python':>10} {'numpy':>10}")
+    for row in results:
+        cells = ["-" if row[name] is None else f"{row[name]:.4f}"
+                 for name in ("textbook", "python", "numpy")]
+        print(f"{row['size']:>6} " + " ".join(f"{cell:>10}" for cell in cells))
+    
+    print(f"\npython beats textbook from n = {find_crossover(results, 'python', 'textbook')}")
+    if numpy is None:
+        print("numpy is not installed; no numpy crossover measured")
+    else:
+        print(f"numpy beats python from n = {find_crossover(results, 'numpy', 'python')}")
+
+
+def generate_input(kind, size, seed=0):
+    """
+    Create a reproducible list of integers for a benchmark.
+    
+    Args:
+        kind (str): One of INPUT_KINDS
+        size (int): Number of items
+        seed (int): Seed for the random generator
+    
+    Returns:
+        list: Integers between -size and size (or between -8 and 7 for
+              "duplicates")
+    """
+    rng = random.Random(f"{kind}-{size}-{seed}")
+    if kind == "duplicates":
+        return [rng.randrange(-8, 8) for _ in range(size)]
+    
+    data = [rng.randint(-size, size) for _ in range(size)]
+    if kind == "sorted":
+        data.sort()
+    elif kind == "reversed":
+        data.sort(reverse=True)
+    elif kind != "random":
+        raise ValueError(f"Unknown input kind: {kind}")
+    return data
+
+
+def _benchmark_cases(data, seed):
+    """
+    Build the calls timed for one input.
+    
+    Args:
+        data (list): Benchmark input
+        seed (int): Seed for the random generator
+    
+    Returns:
+        dict: Maps each algorithm name to (function, items processed)
+    """
+    rng = random.Random(seed)
+    ordered = sorted(data)
+    half = len(data) // 2
+    
+    # Half the lookups hit; the other half fall between two integers and
+    # miss after a full-depth search
+    queries = [rng.choice(data) for _ in range(SEARCH_QUERIES // 2)]
+    queries += [rng.choice(data) + 0.5 for _ in range(SEARCH_QUERIES - len(queries))]
+    rng.shuffle(queries)
+    
+    # Sorting the two halves of the input separately keeps its shape: random
+    # data interleaves, sorted and reversed data merge with few comparisons
+    left, right = sorted(data[:half]), sorted(data[half:])
+    
+    return {
+        # An unreachable target forces two_sum to scan the whole list
+        "two_sum": (functools.partial(two_sum, data, 4 * len(data) + 1), len(data)),
+        "binary_search": (lambda: [binary_search(ordered, q) for q in queries], len(queries)),
+        "merge_sort": (functools.partial(merge_sort, data), len(data)),
+        "merge": (functools.partial(merge, left, right), len(data)),
+        "find_max_subarray_sum": (functools.partial(find_max_subarray_sum, data), len(data)),
+    }
+
+
+def run_suite(sizes=DEFAULT_SIZES, kinds=INPUT_KINDS, seed=0, repeat=3, memory=True):
+    """
+    Benchmark the core algorithms over every size and input kind.
+    
+    Args:
+        sizes (iterable): Input sizes
+        kinds (iterable): Input kinds from INPUT_KINDS
+        seed (int): Seed for the input generators
+        repeat (int): Number of timed runs; the fastest one is kept
+        memory (bool): Whether to also record peak memory with tracemalloc
+    
+    Returns:
+        dict: Maps "algorithm/kind/size" to its seconds, items_per_second
+              and peak_bytes (None when memory is False)
+    """
+    results = {}
+    for size in sizes:
+        for kind in kinds:
+            data = generate_input(kind, size, seed)
+            for name, (func, items) in _benchmark_cases(data, seed).items():
+                seconds = min(_time_call(func) for _ in range(repeat))
+                results[f"{name}/{kind}/{size}"] = {
+                    "seconds": seconds,
+                    "items_per_second": items / seconds if seconds else float("inf"),
+                    "peak_bytes": _peak_memory(func) if memory else None,
+                }
+    return results
+
+
+def save_baseline(results, path):
+    """
+    Write suite results to a JSON baseline file.
+    
+    Args:
+        results (dict): Output of run_suite
+        path (str): Path of the baseline file
+    """
+    baseline = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    with open(path, "w") as file:
+        json.dump(baseline, file, indent=2, sort_keys=True)
+
+
+def load_baseline(path):
+    """
+    Read suite results from a JSON baseline file.
+    
+    Args:
+        path (str): Path of the baseline file
+    
+    Returns:
+        dict: Results in the format returned by run_suite
+    """
+    with open(path) as file:
+        return json.load(file)["results"]
+
+
+def compare_to_baseline(results, baseline, tolerance=0.2):
+    """
+    Flag benchmarks that got slower or use more memory than the baseline.
+    
+    Args:
+        results (dict): Output of run_suite
+        baseline (dict): Earlier results to compare against
+        tolerance (float): Allowed relative change before flagging, e.g. 0.2
+                           flags a 20% drop in throughput or rise in memory
+    
+    Returns:
+        list: One dict per regression with the benchmark name, metric,
+              baseline value, current value and relative change
+    """
+    regressions = []
+    for name, current in sorted(results.items()):
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        
+        old, new = previous["items_per_second"], current["items_per_second"]
+        if old and new < old * (1 - tolerance):
+            regressions.append({"benchmark": name, "metric": "items_per_second",
+                                "baseline": old, "current": new, "change": new / old - 1})
+        
+        old, new = previous.get("peak_bytes"), current["peak_bytes"]
+        if old and new is not None and new > old * (1 + tolerance):
+            regressions.append({"benchmark": name, "metric": "peak_bytes",
+                                "baseline": old, "current": new, "change": new / old - 1})
+    return regressions
+
+
+def _time_call(func):
+    """
+    Time a single call of a function without arguments.
+    
+    Args:
+        func (function): Function to run
+    
+    Returns:
+        float: Seconds elapsed
+    """
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def _peak_memory(func):
+    """
+    Measure the peak memory allocated by a call of a function without arguments.
+    
+    Args:
+        func (function): Function to run
+    
+    Returns:
+        int: Peak bytes allocated during the call
+    """
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def print_results(results):
+    """
+    Print suite results as a table.
+    
+    Args:
+        results (dict): Output of run_suite
+    """
+    print(f"{'benchmark':<42} {'seconds':>10} {'items/s':>14} {'peak KiB':>10}")
+    for name, row in results.items():
+        peak = "-" if row["peak_bytes"] is None else f"{row['peak_bytes'] / 1024:.0f}"
+        print(f"{name:<42} {row['seconds']:>10.4f} {row['items_per_second']:>14,.0f} {peak:>10}")
+
+
+def main():
+    """Run the regression suite from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark the algorithms module")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="input sizes, e.g. 1000 1000000 10000000")
+    parser.add_argument("--kinds", nargs="+", choices=INPUT_KINDS, default=INPUT_KINDS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip the tracemalloc peak memory run")
+    parser.add_argument("--save", metavar="PATH", help="write results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="diff results against a JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--merge-many", action="store_true",
+                        help="run the merge_many comparison instead of the suite")
+    parser.add_argument("--two-sum-index", action="store_true",
+                        help="run the TwoSumIndex comparison instead of the suite")
+    parser.add_argument("--matrix", action="store_true",
+                        help="run the matrix multiplication comparison instead of the suite")
+    args = parser.parse_args()
+    
+    if args.merge_many:
+        print_merge_many()
+        return
+    if args.two_sum_index:
+        print_two_sum_index()
+        return
+    if args.matrix:
+        print_matrix_multiply()
+        return
+    
+    results = run_suite(args.sizes, args.kinds, args.seed, args.repeat, not args.no_memory)
+    print_results(results)
+    
+    if args.save:
+        save_baseline(results, args.save)
+        print(f"\nBaseline written to {args.save}")
+    
+    if args.compare:
+        regressions = compare_to_baseline(results, load_baseline(args.compare), args.tolerance)
+        print(f"\n{len(regressions)} regression(s) against {args.compare}")
+        for row in regressions:
+            print(f"  {row['benchmark']} {row['metric']}: "
+                  f"{row['baseline']:,.0f} -> {row['current']:,.0f} ({row['change']:+.0%})")
+        if regressions:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
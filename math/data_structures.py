@@ -3,10 +3,34 @@ Data Structures Module - Collection of functions for list, array, and set operat
 
 This module provides various data structure operations including:
 - List operations (filtering, transformations)
-- Removing duplicates while preserving order
-- Finding common elements between lists
+- Length-bucketed index for repeated length filters
+- Removing duplicates while preserving order, including from unbounded streams
+- Finding common elements between any number of lists
+- Bulk divisibility masks and inclusion-exclusion counts
+- Periodic, streaming and multi-process number games (ZipZap)
 """
 
+import hashlib
+import math
+import os
+import pickle
+import shutil
+import tempfile
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from fractions import Fraction
+from itertools import chain, combinations, compress, repeat
+
+from algorithms import merge_many
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
 def remove_duplicates(items):
     """
     Removes duplicate values from a list while preserving order.
@@ -28,6 +52,236 @@ def remove_duplicates(items):
     return result
 
 
+def iter_unique(items, max_items=1000000, partitions=64, spill_dir=None):
+    """
+    Yields the unique items of a stream in first-seen order using bounded memory.
+    
+    The first max_items distinct items are tracked in a set and yielded
+    as soon as they are seen. Once the set is full, later items that are
+    not in it are spilled to partition files on disk, chosen by hash, so
+    equal items land in the same partition. When the stream ends each
+    partition is deduplicated on its own and the survivors are merged
+    back into first-seen order, so those items are yielded only after the
+    input is exhausted. Spilled items must be picklable.
+    
+    Args:
+        items (iterable): Stream of hashable items
+        max_items (int): Maximum number of distinct items kept in memory
+        partitions (int): Number of spill partitions; each one must fit in
+                          memory when it is deduplicated
+        spill_dir (str): Directory for the spill files (default: system temp)
+    
+    Yields:
+        Each distinct item once, in the order it first appeared
+    """
+    seen = set()
+    iterator = iter(items)
+    
+    for item in iterator:
+        if item not in seen:
+            seen.add(item)
+            yield item
+            if len(seen) >= max_items:
+                break
+    else:
+        return
+    
+    with tempfile.TemporaryDirectory(prefix="unique_", dir=spill_dir) as work_dir:
+        paths = [os.path.join(work_dir, f"part{i}") for i in range(partitions)]
+        files = [open(path, "wb") for path in paths]
+        try:
+            # Tag spilled items with their position to restore the order later
+            for position, item in enumerate(iterator):
+                if item not in seen:
+                    pickle.dump((position, item), files[hash(item) % partitions])
+        finally:
+            for file in files:
+                file.close()
+        
+        run_paths = []
+        for path in paths:
+            # Records are in stream order, so the first copy of an item wins
+            firsts = {}
+            for position, item in _read_pickled(path):
+                firsts.setdefault(item, position)
+            os.remove(path)
+            if firsts:
+                run_path = path + ".run"
+                with open(run_path, "wb") as file:
+                    for item, position in sorted(firsts.items(), key=lambda pair: pair[1]):
+                        pickle.dump((position, item), file)
+                run_paths.append(run_path)
+        
+        runs = [_read_pickled(path) for path in run_paths]
+        for _, item in merge_many(*runs, key=lambda record: record[0]):
+            yield item
+
+
+def _read_pickled(path):
+    """
+    Reads back records written one by one with pickle.dump.
+    
+    Args:
+        path (str): Path of the file
+    
+    Yields:
+        Each record in the order it was written
+    """
+    with open(path, "rb") as file:
+        while True:
+            try:
+                yield pickle.load(file)
+            except EOFError:
+                return
+
+
+class BloomFilter:
+    """Fixed-size probabilistic set with no false negatives."""
+    
+    def __init__(self, capacity, error_rate=0.01):
+        """
+        Initialize a new BloomFilter.
+        
+        The bit array is sized so that the false-positive rate stays at
+        error_rate until capacity distinct items have been added.
+        
+        Args:
+            capacity (int): Expected number of distinct items
+            error_rate (float): Target false-positive rate, between 0 and 1
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("Error rate must be between 0 and 1")
+        
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+    
+    def _positions(self, item):
+        """
+        Computes the bit positions of an item with double hashing.
+        
+        Both hashes come from a BLAKE2b digest of the item's canonical repr
+        (see _canonical_item) rather than from hash(), whose collisions
+        (hash(-1) == hash(-2), or n and n + 2**61 - 1) would be false
+        positives at any error rate.
+        
+        Args:
+            item: Item whose equal values share a canonical repr
+        
+        Returns:
+            list: hash_count bit positions
+        """
+        digest = hashlib.blake2b(repr(_canonical_item(item)).encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.hash_count)]
+    
+    def add(self, item):
+        """
+        Adds an item to the filter.
+        
+        Args:
+            item: Item whose equal values share a canonical repr
+        
+        Returns:
+            bool: True if the item was definitely not in the filter before,
+                  False if it may have been
+        """
+        bits = self.bits
+        added = False
+        for position in self._positions(item):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                added = True
+        if added:
+            self.count += 1
+        return added
+    
+    def __contains__(self, item):
+        """Checks whether the item may have been added."""
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+    
+    def __len__(self):
+        """Number of items added that were not already reported present."""
+        return self.count
+    
+    def __str__(self):
+        """String representation of a BloomFilter."""
+        return (f"BloomFilter(capacity={self.capacity}, error_rate={self.error_rate}, "
+                f"{len(self.bits)} bytes, {self.hash_count} hashes)")
+
+
+def _canonical_item(item):
+    """
+    Maps equal values to one representative with a deterministic repr.
+    
+    Equal numbers of different types (1, 1.0, True, Fraction(1),
+    Decimal(1) and 1 + 0j) map to the same int or Fraction, tuples are
+    normalized element by element, and frozensets become a tagged sorted
+    list of their elements' canonical reprs. Other items are returned
+    unchanged.
+    
+    Args:
+        item: Item to normalize
+    
+    Returns:
+        Canonical representative of the item
+    """
+    if type(item) is int or type(item) is str:
+        return item
+    if isinstance(item, complex):
+        if item.imag:
+            return ("complex", _canonical_item(item.real), _canonical_item(item.imag))
+        item = item.real
+    if isinstance(item, (int, float, Fraction, Decimal)):
+        if isinstance(item, int):
+            return int(item)
+        if not math.isfinite(item):
+            return float(item)
+        value = Fraction(item)
+        return value.numerator if value.denominator == 1 else value
+    if isinstance(item, tuple):
+        return tuple(map(_canonical_item, item))
+    if isinstance(item, frozenset):
+        return ("frozenset", sorted(repr(_canonical_item(value)) for value in item))
+    return item
+
+
+def iter_unique_approx(items, capacity, error_rate=0.01):
+    """
+    Yields the unique items of a stream using a fixed amount of memory.
+    
+    Items are checked against a BloomFilter, so every duplicate is dropped
+    but a unique item is occasionally dropped too, with probability about
+    error_rate while fewer than capacity distinct items have been seen.
+    Duplicates are recognized by their canonical repr (see _canonical_item):
+    numbers of any built-in numeric type, strings, bytes, and tuples and
+    frozensets of them are covered; items of other types are only
+    recognized as duplicates if equal values have equal reprs.
+    
+    Args:
+        items (iterable): Stream of items (see above for which types are
+                          deduplicated reliably)
+        capacity (int): Expected number of distinct items
+        error_rate (float): Target rate of unique items wrongly dropped
+    
+    Yields:
+        Items in first-seen order, each at most once
+    """
+    seen = BloomFilter(capacity, error_rate)
+    for item in items:
+        if seen.add(item):
+            yield item
+
+
 def find_intersection(list1, list2):
     """
     Finds the common elements between two lists without duplicates.
@@ -39,14 +293,208 @@ def find_intersection(list1, list2):
     Returns:
         list: A list containing the unique common elements
     """
+    return intersect(list1, list2)
+
+
+def intersect(*lists, method="auto"):
+    """
+    Finds the elements common to any number of lists without duplicates.
+    
+    Elements are returned in the order they are first seen in the first
+    list. Three strategies are available:
+    - "hash": set lookups, O(total length) for any hashable elements;
+      unhashable elements such as lists fall back to a linear scan
+    - "sorted": galloping search through lists sorted in ascending order,
+      which skips runs of non-matching elements in O(log gap)
+    - "bitmap": byte masks indexed by value, for dense non-negative
+      integer IDs
+    
+    Args:
+        *lists: Two or more lists to intersect
+        method (str): "auto", "hash", "sorted" or "bitmap". "auto" picks
+                      "bitmap" for dense small integers and "hash" otherwise;
+                      "sorted" is never assumed.
+    
+    Returns:
+        list: A list containing the unique common elements
+    """
+    if len(lists) < 2:
+        raise ValueError("At least two lists are required")
+    
+    if method == "auto":
+        size = _bitmap_size(lists)
+        if size:
+            try:
+                return _intersect_bitmap(lists, size)
+            except TypeError:
+                pass  # Not all elements are ints; fall back to hashing
+        method = "hash"
+    
+    if method == "hash":
+        try:
+            return _intersect_hash(lists)
+        except TypeError:
+            return _intersect_linear(lists)
+    if method == "sorted":
+        return _intersect_sorted(lists)
+    if method == "bitmap":
+        size = _bitmap_size(lists)
+        if size:
+            try:
+                return _intersect_bitmap(lists, size)
+            except TypeError:
+                pass
+        raise ValueError("Bitmap intersection needs small non-negative integers")
+    raise ValueError(f"Unknown intersection method: {method}")
+
+
+# Largest value accepted by the bitmap intersection
+_BITMAP_MAX_VALUE = 1 << 26
+
+
+def _bitmap_size(lists):
+    """
+    Returns the mask size for a bitmap intersection, or 0 if it does not fit.
+    
+    The lists fit if their smallest value is a non-negative int and their
+    largest is small and not much larger than the total number of items
+    (dense IDs). Other element types are caught when the masks are built.
+    
+    Args:
+        lists (tuple): Lists to intersect
+    
+    Returns:
+        int: One more than the largest value, or 0
+    """
+    if not all(lists):
+        return 0
+    try:
+        smallest = min(min(items) for items in lists)
+        largest = max(max(items) for items in lists)
+    except TypeError:
+        return 0
+    if type(smallest) is not int or type(largest) is not int or smallest < 0:
+        return 0
+    
+    total = sum(len(items) for items in lists)
+    if largest >= _BITMAP_MAX_VALUE or largest > 8 * total:
+        return 0
+    return largest + 1
+
+
+def _intersect_hash(lists):
+    """
+    Intersects lists with hash sets.
+    
+    Args:
+        lists (tuple): Lists to intersect
+    
+    Returns:
+        list: Unique common elements in first-seen order
+    """
+    # Intersect the smaller sets first so the working set shrinks quickly
+    others = sorted((set(items) for items in lists[1:]), key=len)
+    common = others[0].intersection(*others[1:])
+    return list(dict.fromkeys(filter(common.__contains__, lists[0])))
+
+
+def _intersect_linear(lists):
+    """
+    Intersects lists by scanning, for elements that cannot be hashed.
+    
+    Args:
+        lists (tuple): Lists to intersect
+    
+    Returns:
+        list: Unique common elements in first-seen order
+    """
     result = []
-    for item in list1:
-        if item in list2 and item not in result:
+    for item in lists[0]:
+        if all(item in items for items in lists[1:]) and item not in result:
+            result.append(item)
+    return result
+
+
+def _intersect_bitmap(lists, size):
+    """
+    Intersects lists of small non-negative integers with byte masks.
+    
+    Args:
+        lists (tuple): Lists to intersect
+        size (int): One more than the largest value in any list
+    
+    Returns:
+        list: Unique common elements in first-seen order
+    """
+    common = None
+    for items in lists[1:]:
+        mask = bytearray(size)
+        # Mark every value without a Python-level loop
+        deque(map(mask.__setitem__, items, repeat(1)), maxlen=0)
+        if common is None:
+            common = mask
+        else:
+            common = (int.from_bytes(common, "little") & int.from_bytes(mask, "little")).to_bytes(size, "little")
+    
+    return list(dict.fromkeys(compress(lists[0], map(common.__getitem__, lists[0]))))
+
+
+def _intersect_sorted(lists):
+    """
+    Intersects lists sorted in ascending order with galloping search.
+    
+    Args:
+        lists (tuple): Sorted lists to intersect
+    
+    Returns:
+        list: Unique common elements in ascending order
+    """
+    # Drive the search from the shortest list
+    lists = sorted(lists, key=len)
+    shortest, others = lists[0], lists[1:]
+    positions = [0] * len(others)
+    result = []
+    
+    for i, item in enumerate(shortest):
+        if i and item == shortest[i - 1]:
+            continue
+        for j, other in enumerate(others):
+            position = _gallop(other, item, positions[j])
+            positions[j] = position
+            if position == len(other):
+                return result
+            if other[position] != item:
+                break
+        else:
             result.append(item)
     
     return result
 
 
+def _gallop(items, target, start):
+    """
+    Finds the first position at or after start whose item is not below target.
+    
+    Probes start, start + 1, start + 3, start + 7, ... and then binary
+    searches the last gap, so the cost grows with the log of the distance.
+    
+    Args:
+        items (list): Sorted list
+        target: Value to search for
+        start (int): Position to search from
+    
+    Returns:
+        int: Position of the first item >= target, or len(items)
+    """
+    n = len(items)
+    low, high, step = start, start, 1
+    while high < n and items[high] < target:
+        low = high + 1
+        high += step
+        step *= 2
+    return bisect_left(items, target, low, min(high, n))
+
+
 def filter_by_length(items, length, predicate=lambda x, y: len(x) == y):
     """
     Filters items in a list based on their length and a predicate.
@@ -76,6 +524,115 @@ def filter_even_length(items):
     return filter_by_length(items, 0, lambda x, y: len(x) % 2 == 0)
 
 
+class LengthIndex:
+    """Index that buckets items by length for repeated length queries."""
+    
+    def __init__(self, items=()):
+        """
+        Initialize a new LengthIndex.
+        
+        Args:
+            items (iterable): Items with a length, e.g. words
+        """
+        self.buckets = {}
+        self.lengths = []
+        self.count = 0
+        self.extend(items)
+    
+    def add(self, item):
+        """
+        Adds one item to the index.
+        
+        Args:
+            item: Item with a length
+        """
+        length = len(item)
+        bucket = self.buckets.get(length)
+        if bucket is None:
+            bucket = self.buckets[length] = []
+            insort(self.lengths, length)
+        bucket.append(item)
+        self.count += 1
+    
+    def extend(self, items):
+        """
+        Adds many items to the index.
+        
+        Args:
+            items (iterable): Items with a length
+        """
+        for item in items:
+            self.add(item)
+    
+    def __len__(self):
+        """Number of items in the index."""
+        return self.count
+    
+    def filter_by_length(self, length):
+        """
+        Returns the items of an exact length.
+        
+        Args:
+            length (int): Length to match
+        
+        Returns:
+            list: Items of that length in insertion order
+        """
+        return list(self.buckets.get(length, ()))
+    
+    def filter_length_range(self, min_length, max_length):
+        """
+        Returns the items whose length is within a range.
+        
+        Args:
+            min_length (int): Smallest length (inclusive)
+            max_length (int): Largest length (inclusive)
+        
+        Returns:
+            list: Items grouped by ascending length, in insertion order
+                  within each length
+        """
+        start = bisect_left(self.lengths, min_length)
+        stop = bisect_right(self.lengths, max_length)
+        return self._concat(self.lengths[start:stop])
+    
+    def filter_even_length(self):
+        """
+        Returns the items with even length.
+        
+        Returns:
+            list: Items grouped by ascending length, in insertion order
+                  within each length
+        """
+        return self._concat(length for length in self.lengths if length % 2 == 0)
+    
+    def filter_odd_length(self):
+        """
+        Returns the items with odd length.
+        
+        Returns:
+            list: Items grouped by ascending length, in insertion order
+                  within each length
+        """
+        return self._concat(length for length in self.lengths if length % 2 == 1)
+    
+    def _concat(self, lengths):
+        """
+        Concatenates the buckets of the given lengths.
+        
+        Args:
+            lengths (iterable): Lengths that have a bucket
+        
+        Returns:
+            list: Items of those buckets in the given order
+        """
+        return list(chain.from_iterable(self.buckets[length] for length in lengths))
+    
+    def __str__(self):
+        """String representation of a LengthIndex."""
+        return f"LengthIndex({len(self)} items, {len(self.buckets)} lengths)"
+
+
 def is_divisible_by_both(number, div1, div2):
     """
     Checks if a number is divisible by both div1 and div2.
@@ -91,6 +648,131 @@ def is_divisible_by_both(number, div1, div2):
     return number % div1 == 0 and number % div2 == 0
 
 
+def count_divisible(start, end, divisors, mode="all"):
+    """
+    Counts the numbers in a range divisible by all or any of the divisors.
+    
+    Uses arithmetic instead of scanning: a number is divisible by all
+    divisors exactly when it is divisible by their lcm, and the "any"
+    count follows from inclusion-exclusion over the 2^k subsets.
+    
+    Args:
+        start (int): Starting number (inclusive)
+        end (int): Ending number (inclusive)
+        divisors (iterable): Positive divisors
+        mode (str): "all" or "any"
+    
+    Returns:
+        int: Count of matching numbers
+    """
+    divisors = _check_divisors(divisors, mode)
+    if end < start:
+        return 0
+    
+    if mode == "all":
+        return _count_multiples(start, end, math.lcm(*divisors))
+    
+    total = 0
+    for size in range(1, len(divisors) + 1):
+        sign = 1 if size % 2 else -1
+        for subset in combinations(divisors, size):
+            total += sign * _count_multiples(start, end, math.lcm(*subset))
+    return total
+
+
+def divisibility_mask(numbers, divisors, mode="all"):
+    """
+    Checks many numbers at once for divisibility by all or any divisors.
+    
+    NumPy arrays get a vectorized NumPy mask. Ranges with step 1 that
+    span at least one lcm(divisors) period are built by repeating the mask
+    of one period instead of testing every number; shorter ranges, or
+    ones with a longer period, are tested number by number.
+    
+    Args:
+        numbers (range, list or numpy.ndarray): Integers to check
+        divisors (iterable): Positive divisors
+        mode (str): "all" or "any"
+    
+    Returns:
+        list or numpy.ndarray: One boolean per number; a NumPy mask for
+                               NumPy arrays, and for ranges when NumPy is
+                               installed
+    """
+    divisors = _check_divisors(divisors, mode)
+    combine = all if mode == "all" else any
+    
+    if numpy is not None and isinstance(numbers, numpy.ndarray):
+        masks = [numbers % divisor == 0 for divisor in divisors]
+        reduce = numpy.logical_and if mode == "all" else numpy.logical_or
+        return reduce.reduce(masks)
+    
+    if isinstance(numbers, range):
+        period = math.lcm(*divisors)
+        if numbers.step == 1 and period <= len(numbers):
+            pattern = [combine(residue % divisor == 0 for divisor in divisors)
+                       for residue in range(period)]
+            
+            # Rotate the pattern so it starts at the first number of the range
+            offset = numbers.start % period
+            pattern = pattern[offset:] + pattern[:offset]
+            if numpy is not None:
+                return numpy.resize(numpy.array(pattern, dtype=bool), len(numbers))
+            repeats = -(-len(numbers) // period)
+            mask = pattern * repeats
+            del mask[len(numbers):]
+            return mask
+        
+        # The ends of a range are its extremes, read in O(1)
+        ends = (numbers[0], numbers[-1]) if numbers else ()
+        if numpy is not None and ends and _INT64_MIN <= min(ends) and max(ends) <= _INT64_MAX:
+            values = numpy.arange(numbers.start, numbers.stop, numbers.step, dtype=numpy.int64)
+            return divisibility_mask(values, divisors, mode)
+    
+    return [combine(number % divisor == 0 for divisor in divisors) for number in numbers]
+
+
+# Bounds of the int64 values a range can be converted to for NumPy
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _count_multiples(start, end, divisor):
+    """
+    Counts the multiples of a positive divisor in [start, end].
+    
+    Args:
+        start (int): Starting number (inclusive)
+        end (int): Ending number (inclusive)
+        divisor (int): Positive divisor
+    
+    Returns:
+        int: Number of multiples
+    """
+    return end // divisor - (start - 1) // divisor
+
+
+def _check_divisors(divisors, mode):
+    """
+    Validates the arguments of the bulk divisibility functions.
+    
+    Args:
+        divisors (iterable): Divisors to check
+        mode (str): Requested mode
+    
+    Returns:
+        list: Distinct divisors
+    """
+    if mode not in ("all", "any"):
+        raise ValueError(f"Unknown mode: {mode}")
+    divisors = list(dict.fromkeys(divisors))
+    if not divisors:
+        raise ValueError("At least one divisor is required")
+    if any(divisor <= 0 for divisor in divisors):
+        raise ValueError("Divisors must be positive")
+    return divisors
+
+
 def number_game(start, end):
     """
     Implements a FizzBuzz-style number game (ZipZap).
@@ -101,6 +783,9 @@ def number_game(start, end):
     - Print "Zap" if divisible by 5
     - Print the number itself for other cases
     
+    See iter_number_game and write_number_game for custom rules and
+    streaming output.
+    
     Args:
         start (int): Starting number (inclusive)
         end (int): Ending number (inclusive)
@@ -108,19 +793,234 @@ def number_game(start, end):
     Returns:
         list: Results of the game for each number
     """
-    results = []
+    return list(iter_number_game(start, end))
+
+
+# Divisor-to-word rules of the classic ZipZap game
+ZIPZAP_RULES = ((3, "Zip"), (5, "Zap"))
+
+# Approximate number of lines formatted per block by the game writers
+GAME_BLOCK_LINES = 4096
+
+
+def iter_number_game(start, end, rules=ZIPZAP_RULES):
+    """
+    Yields the results of a FizzBuzz-style number game one by one.
     
-    for i in range(start, end + 1):
-        if is_divisible_by_both(i, 3, 5):
-            results.append("ZipZap")
-        elif i % 3 == 0:
-            results.append("Zip")
-        elif i % 5 == 0:
-            results.append("Zap")
-        else:
-            results.append(str(i))
+    A number divisible by some of the divisors is replaced by their words
+    joined in rule order (so 15 becomes "ZipZap"); other numbers are
+    written as digits. The output repeats with period lcm(divisors), so
+    when the period is short one period is precomputed and whole blocks
+    are formatted at once; long periods are checked number by number.
+    
+    Args:
+        start (int): Starting number (inclusive)
+        end (int): Ending number (inclusive)
+        rules (tuple): (divisor, word) pairs
+    
+    Yields:
+        str: Result for each number
+    """
+    for block in _number_game_blocks(start, end, rules):
+        yield from block.split("\n")[:-1]
+
+
+def write_number_game(file, start, end, rules=ZIPZAP_RULES):
+    """
+    Writes the results of a number game to a file, one per line.
+    
+    Args:
+        file: Writable text file or stream
+        start (int): Starting number (inclusive)
+        end (int): Ending number (inclusive)
+        rules (tuple): (divisor, word) pairs
+    
+    Returns:
+        int: Number of lines written
+    """
+    for block in _number_game_blocks(start, end, rules):
+        file.write(block)
+    return max(0, end - start + 1)
+
+
+def write_number_game_parallel(path, start, end, rules=ZIPZAP_RULES, workers=4):
+    """
+    Writes the results of a number game to a file using several processes.
+    
+    The range is split into one contiguous segment per worker. Each worker
+    writes its segment to its own part file, and the parts are then joined
+    in order into the output file.
+    
+    Args:
+        path (str): Path of the output file
+        start (int): Starting number (inclusive)
+        end (int): Ending number (inclusive)
+        rules (tuple): (divisor, word) pairs
+        workers (int): Number of worker processes
+    
+    Returns:
+        int: Number of lines written
+    """
+    total = max(0, end - start + 1)
+    segment = -(-total // workers) if total else 1
+    bounds = [(lo, min(lo + segment - 1, end)) for lo in range(start, end + 1, segment)]
+    part_paths = [f"{path}.part{i}" for i in range(len(bounds))]
+    
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_write_number_game_part, part_paths,
+                          [lo for lo, _ in bounds], [hi for _, hi in bounds],
+                          [rules] * len(bounds)))
+        
+        with open(path, "wb") as output:
+            for part_path in part_paths:
+                with open(part_path, "rb") as part:
+                    shutil.copyfileobj(part, output, 1024 * 1024)
+    finally:
+        for part_path in part_paths:
+            if os.path.exists(part_path):
+                os.remove(part_path)
     
-    return results
+    return total
+
+
+def _write_number_game_part(path, start, end, rules):
+    """
+    Writes one segment of a number game to its own file.
+    
+    Args:
+        path (str): Path of the part file
+        start (int): Starting number (inclusive)
+        end (int): Ending number (inclusive)
+        rules (tuple): (divisor, word) pairs
+    
+    Returns:
+        int: Number of lines written
+    """
+    with open(path, "w", buffering=1024 * 1024) as file:
+        return write_number_game(file, start, end, rules)
+
+
+def _number_game_period(rules, limit):
+    """
+    Precomputes one period of a number game, if it is short enough.
+    
+    Args:
+        rules (tuple): (divisor, word) pairs
+        limit (int): Longest period worth precomputing
+    
+    Returns:
+        tuple: (period, words) where words[r] is the output for numbers
+               congruent to r modulo period, or None to print the number;
+               words is None when the period exceeds limit
+    """
+    if not rules:
+        raise ValueError("At least one rule is required")
+    
+    period = 1
+    for divisor, word in rules:
+        if divisor <= 0:
+            raise ValueError("Divisors must be positive")
+        if "\n" in word:
+            raise ValueError("Words must not contain newlines")
+        period = math.lcm(period, divisor)
+    
+    if period > limit:
+        return period, None
+    
+    words = []
+    for residue in range(period):
+        word = "".join(word for divisor, word in rules if residue % divisor == 0)
+        words.append(word or None)
+    return period, words
+
+
+def _number_game_blocks(start, end, rules):
+    """
+    Formats a number game as newline-terminated blocks of text.
+    
+    Numbers before the first multiple of the period, and after the last
+    whole block, are formatted one by one; everything in between uses a
+    precompiled format string covering several whole periods. Periods
+    longer than the range or than GAME_BLOCK_LINES per rule would cost
+    more to precompute than they save, so those games test every number
+    against the divisors instead.
+    
+    Args:
+        start (int): Starting number (inclusive)
+        end (int): Ending number (inclusive)
+        rules (tuple): (divisor, word) pairs
+    
+    Yields:
+        str: Consecutive blocks of output lines
+    """
+    stop = end + 1
+    limit = min(GAME_BLOCK_LINES * len(rules), max(0, stop - start))
+    period, words = _number_game_period(rules, limit)
+    if words is None:
+        for number in range(start, stop, GAME_BLOCK_LINES):
+            yield _check_game_lines(number, min(number + GAME_BLOCK_LINES, stop), rules)
+        return
+    
+    span = period * max(1, GAME_BLOCK_LINES // period)
+    
+    # Field i is filled with the i-th number of the block
+    template = "".join(
+        "{%d}\n" % i if words[i % period] is None
+        else words[i % period].replace("{", "{{").replace("}", "}}") + "\n"
+        for i in range(span))
+    
+    number = start
+    aligned = min(start + (-start) % period, stop)
+    if number < aligned:
+        yield _format_game_lines(number, aligned, period, words)
+        number = aligned
+    
+    while number + span <= stop:
+        yield template.format(*range(number, number + span))
+        number += span
+    
+    if number < stop:
+        yield _format_game_lines(number, stop, period, words)
+
+
+def _format_game_lines(start, stop, period, words):
+    """
+    Formats a short run of a number game one number at a time.
+    
+    Args:
+        start (int): Starting number (inclusive)
+        stop (int): Ending number (exclusive)
+        period (int): Period of the game
+        words (list): Output per residue, or None to print the number
+    
+    Returns:
+        str: Newline-terminated output lines
+    """
+    lines = []
+    for number in range(start, stop):
+        word = words[number % period]
+        lines.append(str(number) if word is None else word)
+    return "\n".join(lines) + "\n"
+
+
+def _check_game_lines(start, stop, rules):
+    """
+    Formats a run of a number game by testing each number against the rules.
+    
+    Args:
+        start (int): Starting number (inclusive)
+        stop (int): Ending number (exclusive)
+        rules (tuple): (divisor, word) pairs
+    
+    Returns:
+        str: Newline-terminated output lines
+    """
+    lines = []
+    for number in range(start, stop):
+        word = "".join(word for divisor, word in rules if number % divisor == 0)
+        lines.append(word or str(number))
+    return "\n".join(lines) + "\n"
 
 
 if __name__ == "__main__":
@@ -140,6 +1040,8 @@ if __name__ == "__main__":
     words = ["apple", "banana", "cherry", "date", "elderberry", "fig"]
     print(f"\nWords: {words}")
     print(f"Words with even length: {filter_even_length(words)}")
+    index = LengthIndex(words)
+    print(f"Words with 4 to 6 letters: {index.filter_length_range(4, 6)}")
     
     # Demo number_game
     print("\nNumber game (ZipZap) from 1 to 15:")
@@ -1,31 +1,1150 @@
 """
 Matrix operations utility module.
-Contains functions for matrix validation, multiplication, and analysis.
+Contains functions for matrix validation, multiplication, and analysis,
+including a maximum-sum subrectangle search, an array-backed Matrix type,
+a compressed sparse row SparseMatrix and a memory-mapped MappedMatrix,
+which the functions accept alongside lists of lists.
 """
 
+import mmap
+import operator
+import os
 import random
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+from itertools import chain, islice, repeat
+from multiprocessing import shared_memory
 
+from algorithms import summarize_subarray
 
-def create_random_matrix(rows, cols, min_val=0, max_val=100):
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class Matrix:
+    """Dense matrix stored in one flat array with row and column strides."""
+    
+    __slots__ = ("data", "rows", "cols", "offset", "row_stride", "col_stride",
+                 "owner", "version", "_lu")
+    
+    def __init__(self, rows, cols, typecode="d", data=None, offset=0,
+                 row_stride=None, col_stride=1, owner=None):
+        """
+        Initialize a new Matrix.
+        
+        Element (i, j) lives at data[offset + i * row_stride + j * col_stride],
+        so row, column and transposed views can share one buffer.
+        
+        Views keep a reference to the matrix that owns the buffer, and
+        every write through the owner or any of its views bumps the
+        owner's version. Cached results such as the LU factorization are
+        tagged with the version they were computed at. Writes made directly
+        to data or through buffer() are not tracked.
+        
+        Args:
+            rows (int): Number of rows
+            cols (int): Number of columns
+            typecode (str): array typecode, "d" for floats or "q" for
+                            64-bit integers (ignored when data is given)
+            data (array.array): Existing buffer to view (default: new zeros)
+            offset (int): Index of element (0, 0) in data
+            row_stride (int): Distance between rows (default: cols)
+            col_stride (int): Distance between columns
+            owner (Matrix): Matrix whose buffer this one views (default:
+                            this matrix owns its buffer)
+        """
+        if rows < 0 or cols < 0:
+            raise ValueError("Matrix dimensions must not be negative")
+        if data is None:
+            if typecode not in _TYPESTRS:
+                raise ValueError(f"Unsupported typecode: {typecode}")
+            data = array(typecode, bytes(rows * cols * array(typecode).itemsize))
+        
+        self.data = data
+        self.rows = rows
+        self.cols = cols
+        self.offset = offset
+        self.row_stride = cols if row_stride is None else row_stride
+        self.col_stride = col_stride
+        self.owner = self if owner is None else owner
+        self.version = 0
+        self._lu = None
+    
+    @classmethod
+    def from_lists(cls, matrix, typecode=None):
+        """
+        Create a contiguous Matrix from a list of lists.
+        
+        Args:
+            matrix (list): Rectangular list of lists
+            typecode (str): "q" or "d"; by default "q" if every value is an
+                            int and "d" otherwise
+        
+        Returns:
+            Matrix: New matrix holding a copy of the values
+        """
+        rows = len(matrix)
+        cols = len(matrix[0]) if rows else 0
+        if any(len(row) != cols for row in matrix):
+            raise ValueError("All rows must have the same length")
+        
+        if typecode is None:
+            is_int = all(type(value) is int for row in matrix for value in row)
+            typecode = "q" if is_int else "d"
+        data = array(typecode)
+        for row in matrix:
+            data.extend(row)
+        return cls(rows, cols, data=data)
+    
+    @property
+    def typecode(self):
+        """array typecode of the underlying buffer."""
+        return self.data.typecode
+    
+    @property
+    def shape(self):
+        """(rows, cols) tuple."""
+        return (self.rows, self.cols)
+    
+    def is_contiguous(self):
+        """Check whether the elements are stored row by row without gaps."""
+        return self.col_stride == 1 and (self.row_stride == self.cols or self.rows <= 1)
+    
+    def __len__(self):
+        """Number of rows, so a Matrix can stand in for a list of lists."""
+        return self.rows
+    
+    def __getitem__(self, index):
+        """
+        Get a row view with matrix[i] or one element with matrix[i, j].
+        
+        Args:
+            index (int or tuple): Row index, or (row, column) pair
+        
+        Returns:
+            MatrixVector or number: Row view or element
+        """
+        if isinstance(index, tuple):
+            i, j = index
+            return self.data[self._position(i, j)]
+        return self.row(index)
+    
+    def __setitem__(self, index, value):
+        """
+        Set one element with matrix[i, j] = value.
+        
+        Args:
+            index (tuple): (row, column) pair
+            value (number): New value
+        """
+        i, j = index
+        self.data[self._position(i, j)] = value
+        self.owner.version += 1
+    
+    def __iter__(self):
+        """Iterate over row views."""
+        for i in range(self.rows):
+            yield self.row(i)
+    
+    def _position(self, i, j):
+        """Index into data of element (i, j), allowing negative indexes."""
+        if i < 0:
+            i += self.rows
+        if j < 0:
+            j += self.cols
+        if not (0 <= i < self.rows and 0 <= j < self.cols):
+            raise IndexError("Matrix index out of range")
+        return self.offset + i * self.row_stride + j * self.col_stride
+    
+    def row(self, i):
+        """
+        Get a zero-copy view of one row.
+        
+        Args:
+            i (int): Row index
+        
+        Returns:
+            MatrixVector: View sharing this matrix's buffer
+        """
+        return MatrixVector(self.data, self._position(i, 0) if self.cols else 0,
+                            self.cols, self.col_stride, self.owner)
+    
+    def column(self, j):
+        """
+        Get a zero-copy view of one column.
+        
+        Args:
+            j (int): Column index
+        
+        Returns:
+            MatrixVector: View sharing this matrix's buffer
+        """
+        return MatrixVector(self.data, self._position(0, j) if self.rows else 0,
+                            self.rows, self.row_stride, self.owner)
+    
+    def diagonal(self):
+        """
+        Get a zero-copy view of the main diagonal.
+        
+        Returns:
+            MatrixVector: View sharing this matrix's buffer
+        """
+        return MatrixVector(self.data, self.offset, min(self.rows, self.cols),
+                            self.row_stride + self.col_stride, self.owner)
+    
+    def transpose(self):
+        """
+        Get a transposed view without copying.
+        
+        Returns:
+            Matrix: View with rows and columns (and their strides) swapped
+        """
+        return Matrix(self.cols, self.rows, data=self.data, offset=self.offset,
+                      row_stride=self.col_stride, col_stride=self.row_stride,
+                      owner=self.owner)
+    
+    T = property(transpose)
+    
+    def copy(self):
+        """
+        Copy the matrix into a new contiguous buffer.
+        
+        Returns:
+            Matrix: Contiguous copy
+        """
+        data = array(self.typecode)
+        for i in range(self.rows):
+            data.extend(self.row(i).toarray())
+        return Matrix(self.rows, self.cols, data=data)
+    
+    def lu(self, exact=None):
+        """
+        Get the LU factorization with partial pivoting, cached until the
+        matrix or one of its views is written to.
+        
+        Args:
+            exact (bool): Factor with Fractions (default: for integer
+                          matrices)
+        
+        Returns:
+            LUDecomposition: Factorization of this matrix
+        """
+        if exact is None:
+            exact = self.typecode == "q"
+        version = self.owner.version
+        if self._lu is not None:
+            cached_version, decomposition = self._lu
+            if cached_version == version and decomposition.exact == exact:
+                return decomposition
+        
+        decomposition = LUDecomposition(self.tolist(), exact)
+        self._lu = (version, decomposition)
+        return decomposition
+    
+    def det(self):
+        """
+        Determinant, from the cached LU factorization.
+        
+        Returns:
+            number: Determinant (exact int for integer matrices)
+        """
+        return self.lu().det()
+    
+    def inverse(self):
+        """
+        Inverse, from the cached LU factorization.
+        
+        Returns:
+            list: Inverse (list of lists, of Fractions for integer matrices)
+        """
+        return self.lu().inverse()
+    
+    def solve(self, b):
+        """
+        Solve self @ x = b, from the cached LU factorization.
+        
+        Args:
+            b (list or Matrix): Right-hand side vector, or matrix whose
+                                columns are right-hand sides
+        
+        Returns:
+            list: Solution vector, or matrix of solution columns
+        """
+        return self.lu().solve(b)
+    
+    def tolist(self):
+        """
+        Convert to a list of lists.
+        
+        Returns:
+            list: Matrix (list of lists) with copies of the values
+        """
+        return [self.row(i).tolist() for i in range(self.rows)]
+    
+    def buffer(self):
+        """
+        Get a memoryview of the elements (contiguous matrices only).
+        
+        Returns:
+            memoryview: Flat view of rows * cols elements
+        """
+        if not self.is_contiguous():
+            raise ValueError("Only contiguous matrices expose a flat buffer; use copy()")
+        view = memoryview(self.data)
+        return view[self.offset:self.offset + self.rows * self.cols]
+    
+    def __buffer__(self, flags):
+        """Buffer protocol hook (Python 3.12+), see buffer()."""
+        return self.buffer()
+    
+    @property
+    def __array_interface__(self):
+        """
+        NumPy array interface, so numpy.asarray(matrix) wraps the buffer.
+        
+        Strides are exported as well, so views wrap without copying too.
+        """
+        address, _ = self.data.buffer_info()
+        itemsize = self.data.itemsize
+        return {
+            "version": 3,
+            "shape": (self.rows, self.cols),
+            "typestr": _TYPESTRS[self.typecode],
+            "data": (address + self.offset * itemsize, False),
+            "strides": (self.row_stride * itemsize, self.col_stride * itemsize),
+        }
+    
+    def __eq__(self, other):
+        """Compare element-wise with another Matrix or a list of lists."""
+        if isinstance(other, Matrix):
+            other = other.tolist()
+        elif not isinstance(other, list):
+            return NotImplemented
+        return self.tolist() == other
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        """Developer representation of a Matrix."""
+        return f"Matrix({self.tolist()!r})"
+    
+    def __str__(self):
+        """String representation of a Matrix."""
+        return f"Matrix({self.rows}x{self.cols}, typecode={self.typecode!r})"
+
+
+class MatrixVector:
+    """Strided view of one row, column or diagonal of a Matrix."""
+    
+    __slots__ = ("data", "offset", "length", "stride", "owner")
+    
+    def __init__(self, data, offset, length, stride, owner=None):
+        """
+        Initialize a new MatrixVector.
+        
+        Args:
+            data (array.array): Buffer shared with the matrix
+            offset (int): Index of the first element in data
+            length (int): Number of elements
+            stride (int): Distance between consecutive elements
+            owner (Matrix): Matrix owning data, whose version is bumped on
+                            writes
+        """
+        self.data = data
+        self.offset = offset
+        self.length = length
+        self.stride = stride
+        self.owner = owner
+    
+    def __len__(self):
+        """Number of elements."""
+        return self.length
+    
+    def _position(self, k):
+        """Index into data of element k, allowing negative indexes."""
+        if k < 0:
+            k += self.length
+        if not 0 <= k < self.length:
+            raise IndexError("Vector index out of range")
+        return self.offset + k * self.stride
+    
+    def __getitem__(self, k):
+        """Element k of the vector."""
+        return self.data[self._position(k)]
+    
+    def __setitem__(self, k, value):
+        """Set element k of the vector in the shared buffer."""
+        self.data[self._position(k)] = value
+        if self.owner is not None:
+            self.owner.version += 1
+    
+    def __iter__(self):
+        """Iterate over the elements."""
+        return iter(self.toarray())
+    
+    def toarray(self):
+        """
+        Copy the elements into a new array with one strided slice.
+        
+        Returns:
+            array.array: Elements of the vector
+        """
+        if not self.length:
+            return array(self.data.typecode)
+        stop = self.offset + (self.length - 1) * self.stride + 1
+        return self.data[self.offset:stop:self.stride]
+    
+    def tolist(self):
+        """
+        Copy the elements into a list.
+        
+        Returns:
+            list: Elements of the vector
+        """
+        return self.toarray().tolist()
+    
+    def __eq__(self, other):
+        """Compare element-wise with another vector or a list."""
+        if isinstance(other, MatrixVector):
+            other = other.tolist()
+        elif not isinstance(other, list):
+            return NotImplemented
+        return self.tolist() == other
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        """Developer representation of a MatrixVector."""
+        return f"MatrixVector({self.tolist()!r})"
+
+
+class LUDecomposition:
+    """LU factorization with partial pivoting of a square matrix."""
+    
+    __slots__ = ("lu", "perm", "sign", "exact", "singular")
+    
+    def __init__(self, matrix, exact=False):
+        """
+        Factor a square matrix as P @ A = L @ U.
+        
+        Gaussian elimination picks the largest remaining entry of each
+        column as pivot. L (unit diagonal, stored below the diagonal) and U
+        (on and above it) share one list of rows, and perm records the
+        original row of each pivot row.
+        
+        Args:
+            matrix (list or Matrix): Square matrix
+            exact (bool): Use Fractions so integer inputs factor exactly
+        """
+        matrix = _to_lists(matrix)
+        n = len(matrix)
+        if any(len(row) != n for row in matrix):
+            raise ValueError("Matrix must be square")
+        
+        convert = Fraction if exact else float
+        lu = [list(map(convert, row)) for row in matrix]
+        perm = list(range(n))
+        sign = 1
+        singular = False
+        
+        for k in range(n):
+            pivot = max(range(k, n), key=lambda i: abs(lu[i][k]))
+            if not lu[pivot][k]:
+                singular = True
+                continue
+            if pivot != k:
+                lu[k], lu[pivot] = lu[pivot], lu[k]
+                perm[k], perm[pivot] = perm[pivot], perm[k]
+                sign = -sign
+            
+            pivot_row = lu[k]
+            tail = pivot_row[k + 1:]
+            for row in lu[k + 1:]:
+                if row[k]:
+                    factor = row[k] / pivot_row[k]
+                    row[k] = factor
+                    row[k + 1:] = map(operator.sub, row[k + 1:], map(factor.__mul__, tail))
+        
+        self.lu = lu
+        self.perm = perm
+        self.sign = sign
+        self.exact = exact
+        self.singular = singular
+    
+    def det(self):
+        """
+        Determinant: the product of U's diagonal, signed by the row swaps.
+        
+        Returns:
+            number: Determinant (int when exact and integral)
+        """
+        if self.singular:
+            return 0
+        result = self.sign
+        for i, row in enumerate(self.lu):
+            result *= row[i]
+        if self.exact and result.denominator == 1:
+            return int(result)
+        return result
+    
+    def solve(self, b):
+        """
+        Solve A @ x = b for one or many right-hand sides.
+        
+        A matrix b is solved for all of its columns at once: the forward
+        and back substitutions update whole rows of the right-hand side,
+        so each step is one map over k values instead of k separate
+        solves.
+        
+        Args:
+            b (list or Matrix): Vector of n values, or n x k matrix whose
+                                columns are right-hand sides
+        
+        Returns:
+            list: Solution vector, or n x k matrix of solution columns
+        """
+        if self.singular:
+            raise ValueError("Matrix is singular")
+        if isinstance(b, MatrixVector):
+            b = b.tolist()
+        b = _to_lists(b)
+        n = len(self.lu)
+        if len(b) != n:
+            raise ValueError("Right-hand side has the wrong number of rows")
+        
+        is_vector = bool(b) and not isinstance(b[0], (list, tuple, MatrixVector))
+        convert = Fraction if self.exact else float
+        rows = [[convert(b[p])] if is_vector else list(map(convert, b[p])) for p in self.perm]
+        
+        # Forward substitution with unit-diagonal L
+        for i in range(n):
+            row, factors = rows[i], self.lu[i]
+            for k in range(i):
+                if factors[k]:
+                    row[:] = map(operator.sub, row, map(factors[k].__mul__, rows[k]))
+        
+        # Back substitution with U
+        for i in range(n - 1, -1, -1):
+            row, factors = rows[i], self.lu[i]
+            for k in range(i + 1, n):
+                if factors[k]:
+                    row[:] = map(operator.sub, row, map(factors[k].__mul__, rows[k]))
+            pivot = factors[i]
+            row[:] = [value / pivot for value in row]
+        
+        if is_vector:
+            return [row[0] for row in rows]
+        return rows
+    
+    def inverse(self):
+        """
+        Inverse, solving for every column of the identity in one batch.
+        
+        Returns:
+            list: Inverse (list of lists)
+        """
+        n = len(self.lu)
+        identity = [[int(i == j) for j in range(n)] for i in range(n)]
+        return self.solve(identity)
+    
+    def __str__(self):
+        """String representation of an LUDecomposition."""
+        mode = "exact" if self.exact else "float"
+        return f"LUDecomposition({len(self.lu)}x{len(self.lu)}, {mode})"
+
+
+class SparseMatrix:
+    """Matrix in compressed sparse row (CSR) form, storing only non-zeros."""
+    
+    __slots__ = ("rows", "cols", "values", "col_indices", "row_ptr")
+    
+    def __init__(self, rows, cols, values, col_indices, row_ptr):
+        """
+        Initialize a new SparseMatrix.
+        
+        The non-zeros of row i are values[row_ptr[i]:row_ptr[i + 1]], in
+        the columns given by the same slice of col_indices.
+        
+        Args:
+            rows (int): Number of rows
+            cols (int): Number of columns
+            values (list): Non-zero values, row by row
+            col_indices (array.array): Column of each value
+            row_ptr (array.array): rows + 1 offsets into values
+        """
+        self.rows = rows
+        self.cols = cols
+        self.values = values
+        self.col_indices = col_indices
+        self.row_ptr = row_ptr
+    
+    @classmethod
+    def from_lists(cls, matrix):
+        """
+        Create a SparseMatrix from a dense list of lists or Matrix.
+        
+        Args:
+            matrix (list or Matrix): Rectangular matrix
+        
+        Returns:
+            SparseMatrix: Matrix holding the non-zero values
+        """
+        matrix = _to_lists(matrix)
+        rows = len(matrix)
+        cols = len(matrix[0]) if rows else 0
+        values, col_indices, row_ptr = [], array("q"), array("q", [0])
+        
+        for row in matrix:
+            if len(row) != cols:
+                raise ValueError("All rows must have the same length")
+            for j, value in enumerate(row):
+                if value:
+                    values.append(value)
+                    col_indices.append(j)
+            row_ptr.append(len(values))
+        
+        return cls(rows, cols, values, col_indices, row_ptr)
+    
+    @property
+    def shape(self):
+        """(rows, cols) tuple."""
+        return (self.rows, self.cols)
+    
+    @property
+    def nnz(self):
+        """Number of stored non-zero values."""
+        return len(self.values)
+    
+    def __len__(self):
+        """Number of rows."""
+        return self.rows
+    
+    def __getitem__(self, index):
+        """
+        Get one element with matrix[i, j] in O(log nnz of the row).
+        
+        Args:
+            index (tuple): (row, column) pair
+        
+        Returns:
+            number: Element, 0 if it is not stored
+        """
+        i, j = index
+        if not (0 <= i < self.rows and 0 <= j < self.cols):
+            raise IndexError("Matrix index out of range")
+        start, stop = self.row_ptr[i], self.row_ptr[i + 1]
+        k = bisect_left(self.col_indices, j, start, stop)
+        if k < stop and self.col_indices[k] == j:
+            return self.values[k]
+        return 0
+    
+    def row_items(self, i):
+        """
+        Get the non-zeros of one row.
+        
+        Args:
+            i (int): Row index
+        
+        Returns:
+            zip: (column, value) pairs in column order
+        """
+        start, stop = self.row_ptr[i], self.row_ptr[i + 1]
+        return zip(self.col_indices[start:stop], self.values[start:stop])
+    
+    def dense_row(self, i):
+        """
+        Expand one row to a dense list.
+        
+        Args:
+            i (int): Row index
+        
+        Returns:
+            list: Row values, zeros included
+        """
+        row = [0] * self.cols
+        for j, value in self.row_items(i):
+            row[j] = value
+        return row
+    
+    def tolist(self):
+        """
+        Convert to a dense list of lists.
+        
+        Returns:
+            list: Matrix (list of lists)
+        """
+        return [self.dense_row(i) for i in range(self.rows)]
+    
+    def is_diagonal(self):
+        """
+        Check if every non-zero lies on the main diagonal, in O(nnz).
+        
+        Returns:
+            bool: True if square and diagonal, False otherwise
+        """
+        if not self.rows or self.rows != self.cols:
+            return False
+        col_indices, row_ptr = self.col_indices, self.row_ptr
+        for i in range(self.rows):
+            for k in range(row_ptr[i], row_ptr[i + 1]):
+                if col_indices[k] != i:
+                    return False
+        return True
+    
+    def diagonal_sum(self):
+        """
+        Sum the main diagonal in O(nnz).
+        
+        Returns:
+            number: Sum of diagonal elements
+        """
+        if not self.rows or self.rows != self.cols:
+            raise ValueError("Matrix must be square to calculate diagonal sum")
+        return sum(value for i in range(self.rows) for j, value in self.row_items(i) if j == i)
+    
+    def multiply(self, other):
+        """
+        Multiply by a dense or sparse matrix, skipping all zero products.
+        
+        Args:
+            other (list, Matrix or SparseMatrix): Right-hand matrix
+        
+        Returns:
+            list or SparseMatrix: Dense list of lists for a dense right-hand
+                                  side, SparseMatrix for a sparse one
+        """
+        if isinstance(other, SparseMatrix):
+            return self._multiply_sparse(other)
+        
+        other = _to_lists(other)
+        if self.cols != len(other):
+            raise ValueError("Matrices are not compatible for multiplication")
+        cols = len(other[0]) if other else 0
+        
+        result = []
+        for i in range(self.rows):
+            row = [0] * cols
+            for k, value in self.row_items(i):
+                row = list(map(operator.add, row, map(operator.mul, repeat(value), other[k])))
+            result.append(row)
+        return result
+    
+    def _multiply_sparse(self, other):
+        """
+        Multiply by another SparseMatrix, row by row.
+        
+        Args:
+            other (SparseMatrix): Right-hand matrix
+        
+        Returns:
+            SparseMatrix: Product without stored zeros
+        """
+        if self.cols != other.rows:
+            raise ValueError("Matrices are not compatible for multiplication")
+        
+        values, col_indices, row_ptr = [], array("q"), array("q", [0])
+        for i in range(self.rows):
+            # Accumulate row i as a sum of scaled rows of other
+            accumulator = {}
+            for k, value in self.row_items(i):
+                for j, other_value in other.row_items(k):
+                    accumulator[j] = accumulator.get(j, 0) + value * other_value
+            for j in sorted(accumulator):
+                if accumulator[j]:
+                    values.append(accumulator[j])
+                    col_indices.append(j)
+            row_ptr.append(len(values))
+        
+        return SparseMatrix(self.rows, other.cols, values, col_indices, row_ptr)
+    
+    def memory_report(self):
+        """
+        Compare the memory of this matrix with its dense forms.
+        
+        Counts container sizes plus one object per stored value, which is
+        what a list of lists of boxed numbers costs.
+        
+        Returns:
+            dict: Bytes used by "sparse", "dense_lists" and "dense_array"
+                  (a Matrix), and the "ratio" of dense lists to sparse
+        """
+        value_bytes = sum(sys.getsizeof(value) for value in self.values)
+        sparse = (sys.getsizeof(self.values) + value_bytes
+                  + sys.getsizeof(self.col_indices) + sys.getsizeof(self.row_ptr))
+        
+        # Every dense row holds pointers to the stored values and to the shared 0
+        row_bytes = sys.getsizeof([0] * self.cols)
+        dense_lists = (sys.getsizeof([None] * self.rows) + self.rows * row_bytes
+                       + value_bytes + sys.getsizeof(0))
+        dense_array = sys.getsizeof(array("d", bytes(8 * self.rows * self.cols)))
+        
+        return {
+            "sparse": sparse,
+            "dense_lists": dense_lists,
+            "dense_array": dense_array,
+            "ratio": dense_lists / sparse,
+        }
+    
+    def __eq__(self, other):
+        """Compare element-wise with another matrix or a list of lists."""
+        if isinstance(other, (SparseMatrix, Matrix)):
+            other = other.tolist()
+        elif not isinstance(other, list):
+            return NotImplemented
+        return self.tolist() == other
+    
+    __hash__ = None
+    
+    def __str__(self):
+        """String representation of a SparseMatrix."""
+        return f"SparseMatrix({self.rows}x{self.cols}, nnz={self.nnz})"
+
+
+class MappedMatrix:
+    """Dense matrix stored in a memory-mapped binary file."""
+    
+    # Magic bytes, format version, typecode, padding, rows, cols
+    HEADER = struct.Struct("<4sBc2xqq8x")
+    MAGIC = b"PYMX"
+    
+    def __init__(self, path, writable=False):
+        """
+        Open an existing matrix file.
+        
+        The file starts with a 32-byte header holding the shape and
+        typecode, followed by the elements row by row. Only the pages that
+        are read or written are loaded into memory.
+        
+        Args:
+            path (str): Path of the matrix file
+            writable (bool): Whether elements may be changed
+        """
+        self.path = path
+        self.writable = writable
+        self.file = open(path, "r+b" if writable else "rb")
+        try:
+            magic, version, typecode, rows, cols = self.HEADER.unpack(
+                self.file.read(self.HEADER.size))
+            if magic != self.MAGIC or version != 1:
+                raise ValueError(f"{path} is not a matrix file")
+            self.typecode = typecode.decode()
+            if self.typecode not in _TYPESTRS:
+                raise ValueError(f"Unsupported typecode: {self.typecode}")
+            self.rows, self.cols = rows, cols
+            
+            access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+            self.mmap = mmap.mmap(self.file.fileno(), 0, access=access)
+            self.data = memoryview(self.mmap)[self.HEADER.size:].cast(self.typecode)
+        except Exception:
+            self.file.close()
+            raise
+    
+    @classmethod
+    def create(cls, path, rows, cols, typecode="d"):
+        """
+        Create a zero-filled matrix file and open it for writing.
+        
+        Args:
+            path (str): Path of the new file (overwritten if it exists)
+            rows (int): Number of rows
+            cols (int): Number of columns
+            typecode (str): "d" for float64 or "q" for int64 elements
+        
+        Returns:
+            MappedMatrix: The new matrix
+        """
+        if typecode not in _TYPESTRS:
+            raise ValueError(f"Unsupported typecode: {typecode}")
+        with open(path, "wb") as file:
+            file.write(cls.HEADER.pack(cls.MAGIC, 1, typecode.encode(), rows, cols))
+            file.truncate(cls.HEADER.size + rows * cols * array(typecode).itemsize)
+        return cls(path, writable=True)
+    
+    @classmethod
+    def from_lists(cls, path, matrix, typecode=None):
+        """
+        Write a matrix to a new file, one row at a time.
+        
+        Args:
+            path (str): Path of the new file
+            matrix (list or Matrix): Matrix to store
+            typecode (str): "q" or "d"; by default "q" if every value is an
+                            int and "d" otherwise
+        
+        Returns:
+            MappedMatrix: The new matrix, open for writing
+        """
+        matrix = _to_lists(matrix)
+        if typecode is None:
+            is_int = all(type(value) is int for row in matrix for value in row)
+            typecode = "q" if is_int else "d"
+        result = cls.create(path, len(matrix), len(matrix[0]) if matrix else 0, typecode)
+        result.write_tile(0, 0, matrix)
+        return result
+    
+    @property
+    def shape(self):
+        """(rows, cols) tuple."""
+        return (self.rows, self.cols)
+    
+    def __len__(self):
+        """Number of rows."""
+        return self.rows
+    
+    def __getitem__(self, index):
+        """Element matrix[i, j]."""
+        return self.data[self._position(*index)]
+    
+    def __setitem__(self, index, value):
+        """Set element matrix[i, j]."""
+        self.data[self._position(*index)] = value
+    
+    def _position(self, i, j):
+        """Index into data of element (i, j)."""
+        if not (0 <= i < self.rows and 0 <= j < self.cols):
+            raise IndexError("Matrix index out of range")
+        return i * self.cols + j
+    
+    def read_tile(self, row_start, row_stop, col_start, col_stop):
+        """
+        Read a rectangular block of elements.
+        
+        Args:
+            row_start (int): First row (inclusive)
+            row_stop (int): Last row (exclusive)
+            col_start (int): First column (inclusive)
+            col_stop (int): Last column (exclusive)
+        
+        Returns:
+            list: Block as a list of lists
+        """
+        cols, data = self.cols, self.data
+        return [data[i * cols + col_start:i * cols + col_stop].tolist()
+                for i in range(row_start, row_stop)]
+    
+    def read_row(self, i):
+        """
+        Read one row.
+        
+        Args:
+            i (int): Row index
+        
+        Returns:
+            list: Row values
+        """
+        return self.read_tile(i, i + 1, 0, self.cols)[0]
+    
+    def write_tile(self, row_start, col_start, tile):
+        """
+        Write a rectangular block of elements.
+        
+        Args:
+            row_start (int): Row of the block's first element
+            col_start (int): Column of the block's first element
+            tile (list): Block as a list of lists
+        """
+        cols, data = self.cols, self.data
+        for i, row in enumerate(tile, row_start):
+            start = i * cols + col_start
+            data[start:start + len(row)] = array(self.typecode, row)
+    
+    def tolist(self):
+        """
+        Read the whole matrix into a list of lists.
+        
+        Returns:
+            list: Matrix (list of lists)
+        """
+        return self.read_tile(0, self.rows, 0, self.cols)
+    
+    def flush(self):
+        """Write changes back to the file."""
+        self.mmap.flush()
+    
+    def close(self):
+        """Flush changes and unmap the file."""
+        if self.file.closed:
+            return
+        self.data.release()
+        if self.writable:
+            self.mmap.flush()
+        self.mmap.close()
+        self.file.close()
+    
+    def __enter__(self):
+        """Use the matrix as a context manager that closes it on exit."""
+        return self
+    
+    def __exit__(self, *exc_info):
+        """Close the matrix when leaving the with block."""
+        self.close()
+    
+    def __str__(self):
+        """String representation of a MappedMatrix."""
+        return f"MappedMatrix({self.rows}x{self.cols}, typecode={self.typecode!r}, path={self.path!r})"
+
+
+# NumPy type strings for the supported array typecodes
+_TYPESTRS = {
+    "d": ("<" if sys.byteorder == "little" else ">") + "f8",
+    "q": ("<" if sys.byteorder == "little" else ">") + "i8",
+}
+
+
+def create_random_matrix(rows, cols, min_val=0, max_val=100, seed=None,
+                         structure="dense", density=0.1, bandwidth=1, output="list"):
     """
     Create a random matrix with the specified dimensions.
     
+    Values are generated in bulk into one flat buffer rather than one
+    randint call per cell: small ranges are cut out of a single
+    getrandbits call, larger ones come from random.choices, and a NumPy
+    Generator fills the buffer with Generator.integers. Structured
+    matrices only draw values for the cells that may be non-zero.
+    
     Args:
         rows (int): Number of rows
         cols (int): Number of columns
         min_val (int): Minimum random value (inclusive)
         max_val (int): Maximum random value (inclusive)
+        seed (int, random.Random or numpy.random.Generator): Seed or
+                        generator for reproducible output (default None
+                        uses the random module's global state)
+        structure (str): "dense"; "sparse" for a density fraction of
+                         randomly placed cells; "diagonal"; or "banded" for
+                         cells within bandwidth of the diagonal. Cells
+                         outside the structure are 0.
+        density (float): Fraction of cells drawn for "sparse"
+        bandwidth (int): Number of diagonals on each side for "banded"
+        output (str): "list" for a list of lists, "matrix" for a Matrix or
+                      "sparse" for a SparseMatrix
         
     Returns:
-        list: A matrix (list of lists) with random values
+        list, Matrix or SparseMatrix: A matrix with random values
     """
-    matrix = []
-    for i in range(rows):
-        row = []
-        for j in range(cols):
-            row.append(random.randint(min_val, max_val))
-        matrix.append(row)
-    return matrix
+    if min_val > max_val:
+        raise ValueError("min_val must not exceed max_val")
+    if output not in ("list", "matrix", "sparse"):
+        raise ValueError(f"Unknown output: {output}")
+    
+    if seed is None:
+        rng = random
+    elif isinstance(seed, random.Random):
+        rng = seed
+    elif numpy is not None and isinstance(seed, numpy.random.Generator):
+        rng = seed
+    else:
+        rng = random.Random(seed)
+    
+    total = rows * cols
+    if structure == "dense":
+        positions = range(total)
+    elif structure == "sparse":
+        if not 0 <= density <= 1:
+            raise ValueError("Density must be between 0 and 1")
+        count = round(density * total)
+        if numpy is not None and isinstance(rng, numpy.random.Generator):
+            positions = sorted(rng.choice(total, size=count, replace=False).tolist())
+        else:
+            positions = sorted(rng.sample(range(total), count))
+    elif structure == "diagonal":
+        positions = range(0, min(rows, cols) * (cols + 1), cols + 1)
+    elif structure == "banded":
+        positions = [i * cols + j for i in range(rows)
+                     for j in range(max(0, i - bandwidth), min(cols, i + bandwidth + 1))]
+    else:
+        raise ValueError(f"Unknown structure: {structure}")
+    
+    values = _random_values(rng, len(positions), min_val, max_val)
+    
+    if output == "sparse":
+        return _sparse_from_positions(rows, cols, positions, values)
+    if structure == "dense":
+        flat = values
+    else:
+        flat = [0] * total
+        for position, value in zip(positions, values):
+            flat[position] = value
+    
+    if output == "matrix":
+        return Matrix(rows, cols, typecode="q", data=array("q", flat))
+    if not cols:
+        return [[] for _ in range(rows)]
+    return [flat[start:start + cols] for start in range(0, total, cols)]
+
+
+def _random_values(rng, count, min_val, max_val):
+    """
+    Draw count uniform random integers in one batch.
+    
+    Args:
+        rng: random module, random.Random or numpy.random.Generator
+        count (int): Number of values
+        min_val (int): Minimum value (inclusive)
+        max_val (int): Maximum value (inclusive)
+    
+    Returns:
+        list: Random integers
+    """
+    span = max_val - min_val + 1
+    if numpy is not None and isinstance(rng, numpy.random.Generator):
+        return rng.integers(min_val, max_val, size=count, endpoint=True).tolist()
+    
+    if span > 1 << 32:
+        return [rng.randrange(min_val, max_val + 1) for _ in range(count)]
+    if span > 256:
+        return rng.choices(range(min_val, max_val + 1), k=count)
+    
+    # One random byte per value: map accepted bytes to the range with a
+    # translation table and delete the bytes that would bias the modulo
+    limit = 256 - 256 % span
+    table = bytes(value % span for value in range(256))
+    rejected = bytes(range(limit, 256))
+    accepted = b""
+    while len(accepted) < count:
+        needed = count - len(accepted)
+        batch = needed + needed * (256 - limit) // limit + 16
+        accepted += rng.getrandbits(8 * batch).to_bytes(batch, "little").translate(table, rejected)
+    
+    if min_val:
+        return list(map(min_val.__add__, accepted[:count]))
+    return list(accepted[:count])
+
+
+def _sparse_from_positions(rows, cols, positions, values):
+    """
+    Build a SparseMatrix from sorted flat cell positions and their values.
+    
+    Args:
+        rows (int): Number of rows
+        cols (int): Number of columns
+        positions (sequence): Increasing flat indices i * cols + j
+        values (list): Value of each position; zeros are not stored
+    
+    Returns:
+        SparseMatrix: The matrix
+    """
+    stored, col_indices, row_ptr = [], array("q"), array("q", [0])
+    
+    for position, value in zip(positions, values):
+        if not value:
+            continue
+        i, j = divmod(position, cols)
+        while len(row_ptr) <= i:
+            row_ptr.append(len(stored))
+        stored.append(value)
+        col_indices.append(j)
+    
+    while len(row_ptr) <= rows:
+        row_ptr.append(len(stored))
+    return SparseMatrix(rows, cols, stored, col_indices, row_ptr)
 
 
 def print_matrix(matrix):
@@ -33,9 +1152,9 @@ def print_matrix(matrix):
     Print a matrix in a readable format.
     
     Args:
-        matrix (list): Matrix to print
+        matrix (list, Matrix, SparseMatrix or MappedMatrix): Matrix to print
     """
-    for row in matrix:
+    for row in _iter_rows(matrix):
         print(row)
 
 
@@ -44,7 +1163,7 @@ def is_square_matrix(matrix):
     Check if the matrix is square (rows = columns).
     
     Args:
-        matrix (list): Matrix to check
+        matrix (list, Matrix, SparseMatrix or MappedMatrix): Matrix to check
         
     Returns:
         bool: True if square, False otherwise
@@ -53,6 +1172,9 @@ def is_square_matrix(matrix):
     if not matrix:
         return False
     
+    if isinstance(matrix, (Matrix, SparseMatrix, MappedMatrix)):
+        return matrix.rows == matrix.cols
+    
     # Get the number of rows
     rows = len(matrix)
     
@@ -69,19 +1191,20 @@ def is_diagonal_matrix(matrix):
     Check if the matrix is diagonal (non-zero elements only on the main diagonal).
     
     Args:
-        matrix (list): Matrix to check
+        matrix (list, Matrix, SparseMatrix or MappedMatrix): Matrix to check
         
     Returns:
         bool: True if diagonal, False otherwise
     """
+    if isinstance(matrix, SparseMatrix):
+        return matrix.is_diagonal()
+    
     if not is_square_matrix(matrix):
         return False
     
-    n = len(matrix)
-    for i in range(n):
-        for j in range(n):
-            if i != j and matrix[i][j] != 0:
-                return False
+    for i, row in enumerate(_iter_rows(matrix)):
+        if any(row[:i]) or any(row[i + 1:]):
+            return False
     
     return True
 
@@ -91,7 +1214,7 @@ def diagonal_sum(matrix):
     Calculate the sum of elements on the main diagonal.
     
     Args:
-        matrix (list): Matrix to sum
+        matrix (list, Matrix, SparseMatrix or MappedMatrix): Matrix to sum
         
     Returns:
         float: Sum of diagonal elements
@@ -99,9 +1222,39 @@ def diagonal_sum(matrix):
     if not is_square_matrix(matrix):
         raise ValueError("Matrix must be square to calculate diagonal sum")
     
+    if isinstance(matrix, Matrix):
+        return sum(matrix.diagonal().toarray())
+    if isinstance(matrix, SparseMatrix):
+        return matrix.diagonal_sum()
+    if isinstance(matrix, MappedMatrix):
+        return sum(matrix[i, i] for i in range(matrix.rows))
+    
     return sum(matrix[i][i] for i in range(len(matrix)))
 
 
+def _iter_rows(matrix):
+    """
+    Stream the rows of any supported matrix type as lists.
+    
+    Rows of a SparseMatrix or MappedMatrix are expanded or read one at a
+    time, so the whole matrix is never materialized.
+    
+    Args:
+        matrix (list, Matrix, SparseMatrix or MappedMatrix): Matrix to read
+    
+    Returns:
+        iterable: Rows as lists (or the list of lists itself)
+    """
+    if isinstance(matrix, Matrix):
+        # Copy rows out in one strided slice each instead of per element
+        return (row.tolist() for row in matrix)
+    if isinstance(matrix, SparseMatrix):
+        return map(matrix.dense_row, range(matrix.rows))
+    if isinstance(matrix, MappedMatrix):
+        return map(matrix.read_row, range(matrix.rows))
+    return matrix
+
+
 def can_multiply(matrix1, matrix2):
     """
     Check if two matrices can be multiplied (cols of first = rows of second).
@@ -118,56 +1271,1101 @@ def can_multiply(matrix1, matrix2):
         return False
     
     # Get dimensions
-    cols1 = len(matrix1[0]) if matrix1 and matrix1[0] else 0
+    if isinstance(matrix1, (SparseMatrix, MappedMatrix)):
+        cols1 = matrix1.cols
+    else:
+        cols1 = len(matrix1[0]) if matrix1 and matrix1[0] else 0
     rows2 = len(matrix2)
     
     return cols1 == rows2
 
 
-def multiply_matrices(matrix1, matrix2):
+def multiply_matrices(matrix1, matrix2, backend="auto", block_size=64, workers=None,
+                      out=None, memory_limit=64 * 1024 * 1024):
     """
     Multiply two matrices.
     
+    The pure-Python path transposes matrix2 once so every output element
+    is a dot product of two contiguous sequences, and walks the columns in
+    tiles of block_size so each tile stays in cache while every row of
+    matrix1 is multiplied against it. The NumPy path uses the @ operator.
+    
+    With workers, the pure-Python path splits the output rows across a
+    process pool. The operands are placed in shared memory once and each
+    worker writes its rows straight into a shared output buffer, so no
+    matrix data is pickled per task.
+    
+    If either input is a MappedMatrix the product is computed tile by tile
+    into the mapped file out, keeping memory bounded by memory_limit.
+    
     Args:
-        matrix1 (list): First matrix
-        matrix2 (list): Second matrix
+        matrix1 (list or Matrix): First matrix
+        matrix2 (list or Matrix): Second matrix
+        backend (str): "python", "numpy", or "auto" to use NumPy when it is
+                       installed, the product is large enough to repay the
+                       conversion, and both inputs convert to int64 or
+                       float64 arrays without risk of integer overflow
+        block_size (int): Number of matrix2 columns per tile
+        workers (int): Number of processes for the pure-Python path (default
+                       None runs in the current process). Products whose
+                       values do not fit in 64 bits run in one process.
+        out (str or MappedMatrix): Output file for products of MappedMatrix
+                                   inputs
+        memory_limit (int): Approximate bytes of tiles held in memory for
+                            products of MappedMatrix inputs
         
     Returns:
-        list: Result of matrix multiplication
+        list, Matrix or SparseMatrix: Result of matrix multiplication, a
+                        Matrix if either input is one; products involving a
+                        SparseMatrix follow SparseMatrix.multiply
     """
     if not can_multiply(matrix1, matrix2):
         raise ValueError("Matrices are not compatible for multiplication")
+    if backend not in ("auto", "python", "numpy"):
+        raise ValueError(f"Unknown backend: {backend}")
+    
+    if isinstance(matrix1, MappedMatrix) or isinstance(matrix2, MappedMatrix):
+        if out is None:
+            raise ValueError("An output file is required to multiply mapped matrices")
+        return multiply_mapped(matrix1, matrix2, out, memory_limit)
+    if isinstance(matrix1, SparseMatrix):
+        return matrix1.multiply(matrix2)
+    if isinstance(matrix2, SparseMatrix):
+        return _multiply_dense_sparse(_to_lists(matrix1), matrix2)
+    
+    as_matrix = isinstance(matrix1, Matrix) or isinstance(matrix2, Matrix)
     
-    rows1 = len(matrix1)
-    cols2 = len(matrix2[0])
+    if workers and workers > 1 and backend != "numpy":
+        result = _multiply_parallel(matrix1, matrix2, workers)
+        if result is not None:
+            return result if as_matrix else result.tolist()
     
-    # Initialize result matrix with zeros
-    result = [[0 for _ in range(cols2)] for _ in range(rows1)]
+    arrays = None
+    if backend != "python":
+        work = len(matrix1) * len(matrix2) * len(matrix2[0])
+        if backend == "numpy" or work >= NUMPY_MIN_WORK:
+            arrays = _numpy_operands(matrix1, matrix2)
+        if arrays is None and backend == "numpy":
+            raise ValueError("Matrices cannot be multiplied exactly with NumPy")
     
-    # Perform matrix multiplication
-    for i in range(rows1):
-        for j in range(cols2):
-            for k in range(len(matrix2)):
-                result[i][j] += matrix1[i][k] * matrix2[k][j]
+    if arrays is not None:
+        product = arrays[0] @ arrays[1]
+        if as_matrix:
+            typecode = "q" if product.dtype.kind == "i" else "d"
+            return Matrix(product.shape[0], product.shape[1],
+                          data=array(typecode, product.astype(_TYPESTRS[typecode]).tobytes()))
+        return product.tolist()
     
+    result = _multiply_blocked(_to_lists(matrix1), _to_lists(matrix2), block_size)
+    if as_matrix:
+        return Matrix.from_lists(result, _result_typecode(result, (matrix1, matrix2)))
     return result
 
 
-# Example usage
-def demo():
-    """Demonstrate matrix operations."""
-    # Create random matrices
-    matrix1 = create_random_matrix(3, 3)
-    matrix2 = create_random_matrix(3, 2)
+# Smallest number of scalar multiplications for which "auto" picks NumPy
+# (see benchmarks.benchmark_matrix_multiply for measuring the crossover)
+NUMPY_MIN_WORK = 32 ** 3
+
+
+def multiply_mapped(matrix1, matrix2, out, memory_limit=64 * 1024 * 1024):
+    """
+    Multiply matrices tile by tile into a memory-mapped output file.
     
-    print("Matrix 1:")
-    print_matrix(matrix1)
+    Output tiles are computed one at a time: the matching row strip of
+    matrix1 and column strip of matrix2 are streamed in tile by tile and
+    the finished tile is written straight to out. Only three tiles are
+    held in memory at once, sized from memory_limit assuming roughly
+    40 bytes per boxed Python number.
     
-    print("\nMatrix 2:")
-    print_matrix(matrix2)
+    Args:
+        matrix1 (MappedMatrix, Matrix or list): First matrix
+        matrix2 (MappedMatrix, Matrix or list): Second matrix
+        out (str or MappedMatrix): Path of the output file to create, or an
+                                   open writable MappedMatrix of the right shape
+        memory_limit (int): Approximate bytes of tiles held in memory
     
-    # Check if matrix1 is square
-    print(f"\nMatrix 1 is square: {is_square_matrix(matrix1)}")
+    Returns:
+        MappedMatrix: The output matrix, open for writing
+    """
+    rows, inner = _shape(matrix1)
+    inner2, cols = _shape(matrix2)
+    if not rows or inner != inner2:
+        raise ValueError("Matrices are not compatible for multiplication")
+    
+    tile = max(1, int((memory_limit / (3 * _BYTES_PER_ELEMENT)) ** 0.5))
+    
+    if not isinstance(out, MappedMatrix):
+        typecodes = {getattr(m, "typecode", "q") for m in (matrix1, matrix2)}
+        if any(type(value) is float for m in (matrix1, matrix2) if isinstance(m, list)
+               for row in m for value in row):
+            typecodes.add("d")
+        out = MappedMatrix.create(out, rows, cols, "d" if "d" in typecodes else "q")
+    elif out.shape != (rows, cols):
+        raise ValueError("Output matrix has the wrong shape")
+    
+    read1, read2 = _tile_reader(matrix1), _tile_reader(matrix2)
+    for row_start in range(0, rows, tile):
+        row_stop = min(row_start + tile, rows)
+        for col_start in range(0, cols, tile):
+            col_stop = min(col_start + tile, cols)
+            result = [[0] * (col_stop - col_start) for _ in range(row_stop - row_start)]
+            
+            for k_start in range(0, inner, tile):
+                k_stop = min(k_start + tile, inner)
+                left = read1(row_start, row_stop, k_start, k_stop)
+                columns = list(zip(*read2(k_start, k_stop, col_start, col_stop)))
+                for out_row, row in zip(result, left):
+                    out_row[:] = map(operator.add, out_row,
+                                     [sum(map(operator.mul, row, column)) for column in columns])
+            
+            out.write_tile(row_start, col_start, result)
+    
+    out.flush()
+    return out
+
+
+# Rough size of one boxed number in a list, for sizing tiles
+_BYTES_PER_ELEMENT = 40
+
+
+def _shape(matrix):
+    """
+    Get the (rows, cols) of any supported matrix type.
+    
+    Args:
+        matrix (list, Matrix, SparseMatrix or MappedMatrix): Matrix
+    
+    Returns:
+        tuple: (rows, cols)
+    """
+    if isinstance(matrix, (Matrix, SparseMatrix, MappedMatrix)):
+        return matrix.shape
+    return (len(matrix), len(matrix[0]) if matrix else 0)
+
+
+def _tile_reader(matrix):
+    """
+    Get a function reading rectangular blocks of a matrix.
+    
+    Args:
+        matrix (list, Matrix or MappedMatrix): Matrix to read
+    
+    Returns:
+        function: read(row_start, row_stop, col_start, col_stop) -> list of lists
+    """
+    if isinstance(matrix, MappedMatrix):
+        return matrix.read_tile
+    matrix = _to_lists(matrix)
+    return lambda r0, r1, c0, c1: [row[c0:c1] for row in matrix[r0:r1]]
+
+
+def _multiply_dense_sparse(dense, sparse):
+    """
+    Multiply a dense list of lists by a SparseMatrix.
+    
+    Args:
+        dense (list): Left-hand matrix
+        sparse (SparseMatrix): Right-hand matrix
+    
+    Returns:
+        list: Dense result (list of lists)
+    """
+    result = []
+    for row in dense:
+        out = [0] * sparse.cols
+        for k, value in enumerate(row):
+            if value:
+                for j, other_value in sparse.row_items(k):
+                    out[j] += value * other_value
+        result.append(out)
+    return result
+
+
+def _multiply_blocked(matrix1, matrix2, block_size):
+    """
+    Multiply two lists of lists with column tiling.
+    
+    Args:
+        matrix1 (list): First matrix
+        matrix2 (list): Second matrix
+        block_size (int): Number of matrix2 columns per tile
+    
+    Returns:
+        list: Result of matrix multiplication
+    """
+    # Columns of matrix2 as contiguous tuples, built once
+    columns = list(zip(*matrix2))
+    result = [[] for _ in matrix1]
+    
+    for start in range(0, len(columns), block_size):
+        tile = columns[start:start + block_size]
+        for row, out in zip(matrix1, result):
+            out.extend([sum(map(operator.mul, row, column)) for column in tile])
+    
+    return result
+
+
+def strassen_multiply(matrix1, matrix2, cutover=128, block_size=64):
+    """
+    Multiply two matrices with Strassen's algorithm.
+    
+    Each level replaces 8 half-size products with 7, for O(n^2.81) work.
+    Only additions, subtractions and multiplications are used, so integer
+    results are exact. The inputs are zero-padded to a common square size
+    that halves evenly down to the cutover, where a blocked product writes
+    straight into the output. Sub-matrices are addressed by offsets rather
+    than sliced out, and all temporaries are preallocated once per
+    recursion level.
+    
+    Args:
+        matrix1 (list or Matrix): First matrix
+        matrix2 (list or Matrix): Second matrix
+        cutover (int): Largest size multiplied directly with the blocked product
+        block_size (int): Column tile size of the blocked product
+    
+    Returns:
+        list or Matrix: Result of matrix multiplication, a Matrix if either
+                        input is one
+    """
+    if not can_multiply(matrix1, matrix2):
+        raise ValueError("Matrices are not compatible for multiplication")
+    if cutover < 1:
+        raise ValueError("Cutover must be at least 1")
+    
+    as_matrix = isinstance(matrix1, Matrix) or isinstance(matrix2, Matrix)
+    first, second = _to_lists(matrix1), _to_lists(matrix2)
+    rows, inner, cols = len(first), len(second), len(second[0])
+    
+    # Pad to base * 2^levels with base <= cutover
+    base, levels = max(rows, inner, cols), 0
+    while base > cutover:
+        base = -(-base // 2)
+        levels += 1
+    size = base << levels
+    
+    if levels == 0:
+        result = _multiply_blocked(first, second, block_size)
+    else:
+        padded1 = _zero_pad(first, size)
+        padded2 = _zero_pad(second, size)
+        result = [[0] * size for _ in range(size)]
+        
+        # Operand sums and product buffers for each level, reused by every call
+        workspaces = []
+        half = size // 2
+        for _ in range(levels):
+            workspaces.append(tuple([[0] * half for _ in range(half)] for _ in range(3)))
+            half //= 2
+        workspaces.append(([[0] * base for _ in range(base)], [0] * base))
+        
+        _strassen(padded1, 0, 0, padded2, 0, 0, result, 0, 0, size, workspaces, 0, block_size)
+        result = [row[:cols] for row in result[:rows]]
+    
+    if as_matrix:
+        return Matrix.from_lists(result, _result_typecode(result, (matrix1, matrix2)))
+    return result
+
+
+def _zero_pad(matrix, size):
+    """
+    Copy a matrix into the top-left corner of a size x size zero matrix.
+    
+    Args:
+        matrix (list): Matrix (list of lists)
+        size (int): Size of the padded matrix
+    
+    Returns:
+        list: Padded matrix
+    """
+    padded = [list(row) + [0] * (size - len(row)) for row in matrix]
+    padded.extend([0] * size for _ in range(size - len(matrix)))
+    return padded
+
+
+def _strassen(a, ar, ac, b, br, bc, c, cr, cc, n, workspaces, level, block_size):
+    """
+    Write the product of two n x n blocks into a block of c.
+    
+    Each block is given as a matrix with the row and column offsets of its
+    top-left corner.
+    
+    Args:
+        a, ar, ac: First operand block
+        b, br, bc: Second operand block
+        c, cr, cc: Output block, overwritten
+        n (int): Block size
+        workspaces (list): (left, right, product) buffers per level, then
+                           the (columns, segment) buffers of the base case
+        level (int): Recursion level, selecting the workspace
+        block_size (int): Column tile size of the blocked product
+    """
+    if level == len(workspaces) - 1:
+        _multiply_block(a, ar, ac, b, br, bc, c, cr, cc, n, workspaces[level], block_size)
+        return
+    
+    h = n // 2
+    left, right, product = workspaces[level]
+    
+    def multiply(x, xr, xc, y, yr, yc):
+        _strassen(x, xr, xc, y, yr, yc, product, 0, 0, h, workspaces, level + 1, block_size)
+    
+    add, sub = operator.add, operator.sub
+    a11, a12, a21, a22 = (ar, ac), (ar, ac + h), (ar + h, ac), (ar + h, ac + h)
+    b11, b12, b21, b22 = (br, bc), (br, bc + h), (br + h, bc), (br + h, bc + h)
+    c11, c12, c21, c22 = (cr, cc), (cr, cc + h), (cr + h, cc), (cr + h, cc + h)
+    
+    # M1 = (A11 + A22)(B11 + B22): C11 = M1, C22 = M1
+    _combine(left, a, a11, a, a22, h, add)
+    _combine(right, b, b11, b, b22, h, add)
+    multiply(left, 0, 0, right, 0, 0)
+    _store(c, c11, product, h, None)
+    _store(c, c22, product, h, None)
+    
+    # M2 = (A21 + A22) B11: C21 = M2, C22 -= M2
+    _combine(left, a, a21, a, a22, h, add)
+    multiply(left, 0, 0, b, *b11)
+    _store(c, c21, product, h, None)
+    _store(c, c22, product, h, sub)
+    
+    # M3 = A11 (B12 - B22): C12 = M3, C22 += M3
+    _combine(right, b, b12, b, b22, h, sub)
+    multiply(a, *a11, right, 0, 0)
+    _store(c, c12, product, h, None)
+    _store(c, c22, product, h, add)
+    
+    # M4 = A22 (B21 - B11): C11 += M4, C21 += M4
+    _combine(right, b, b21, b, b11, h, sub)
+    multiply(a, *a22, right, 0, 0)
+    _store(c, c11, product, h, add)
+    _store(c, c21, product, h, add)
+    
+    # M5 = (A11 + A12) B22: C11 -= M5, C12 += M5
+    _combine(left, a, a11, a, a12, h, add)
+    multiply(left, 0, 0, b, *b22)
+    _store(c, c11, product, h, sub)
+    _store(c, c12, product, h, add)
+    
+    # M6 = (A21 - A11)(B11 + B12): C22 += M6
+    _combine(left, a, a21, a, a11, h, sub)
+    _combine(right, b, b11, b, b12, h, add)
+    multiply(left, 0, 0, right, 0, 0)
+    _store(c, c22, product, h, add)
+    
+    # M7 = (A12 - A22)(B21 + B22): C11 += M7
+    _combine(left, a, a12, a, a22, h, sub)
+    _combine(right, b, b21, b, b22, h, add)
+    multiply(left, 0, 0, right, 0, 0)
+    _store(c, c11, product, h, add)
+
+
+def _multiply_block(a, ar, ac, b, br, bc, c, cr, cc, n, workspace, block_size):
+    """
+    Write the product of two n x n blocks into a block of c in place.
+    
+    The blocks are read at their offsets rather than sliced out: the
+    columns of b's block are gathered into a preallocated buffer, each row
+    of a's block is copied into a preallocated segment, and the results are
+    assigned straight into c.
+    
+    Args:
+        a, ar, ac: First operand block
+        b, br, bc: Second operand block
+        c, cr, cc: Output block, overwritten
+        n (int): Block size
+        workspace (tuple): (columns, segment) buffers of size n x n and n
+        block_size (int): Number of columns per tile
+    """
+    columns, segment = workspace
+    for column, values in zip(columns, zip(*[islice(row, bc, bc + n) for row in b[br:br + n]])):
+        column[:] = values
+    
+    mul = operator.mul
+    tiles = [(cc + start, columns[start:start + block_size]) for start in range(0, n, block_size)]
+    for i in range(n):
+        segment[:] = islice(a[ar + i], ac, ac + n)
+        row = c[cr + i]
+        for first, tile in tiles:
+            row[first:first + len(tile)] = [sum(map(mul, segment, column)) for column in tile]
+
+
+def _combine(out, x, x_corner, y, y_corner, h, op):
+    """
+    Overwrite an h x h buffer with op applied to two blocks element-wise.
+    
+    Args:
+        out (list): Destination buffer with h rows of length h
+        x, x_corner: First block as a matrix and (row, column) offsets
+        y, y_corner: Second block as a matrix and (row, column) offsets
+        h (int): Block size
+        op (function): operator.add or operator.sub
+    """
+    xr, xc = x_corner
+    yr, yc = y_corner
+    for i in range(h):
+        out[i][:] = map(op, x[xr + i][xc:xc + h], y[yr + i][yc:yc + h])
+
+
+def _store(c, corner, block, h, op):
+    """
+    Write an h x h block into c, or accumulate it with op.
+    
+    Args:
+        c (list): Destination matrix
+        corner (tuple): (row, column) offsets in c
+        block (list): Source block with h rows of length h
+        h (int): Block size
+        op (function): None to overwrite, else operator.add or operator.sub
+    """
+    cr, cc = corner
+    for i in range(h):
+        row = c[cr + i]
+        if op is None:
+            row[cc:cc + h] = block[i]
+        else:
+            row[cc:cc + h] = map(op, row[cc:cc + h], block[i])
+
+
+def chain_order(dimensions):
+    """
+    Find the cheapest parenthesization of a matrix chain.
+    
+    Classic O(n^3) dynamic programming: cost[i][j] is the fewest scalar
+    multiplications needed to form the product of matrices i..j, found by
+    trying every split point between them.
+    
+    Args:
+        dimensions (list): n + 1 sizes; matrix i is dimensions[i] x
+                           dimensions[i + 1]
+    
+    Returns:
+        tuple: (cost, split) where cost is the minimal number of scalar
+               multiplications and split[i][j] is the index k at which the
+               product of matrices i..j is split into i..k and k+1..j
+    """
+    n = len(dimensions) - 1
+    cost = [[0] * n for _ in range(n)]
+    split = [[0] * n for _ in range(n)]
+    
+    for length in range(2, n + 1):
+        for i in range(n - length + 1):
+            j = i + length - 1
+            outer = dimensions[i] * dimensions[j + 1]
+            best, best_k = None, i
+            for k in range(i, j):
+                candidate = cost[i][k] + cost[k + 1][j] + outer * dimensions[k + 1]
+                if best is None or candidate < best:
+                    best, best_k = candidate, k
+            cost[i][j], split[i][j] = best, best_k
+    
+    return (cost[0][n - 1] if n else 0), split
+
+
+def chain_plan(*matrices):
+    """
+    Describe the optimal multiplication order of a matrix chain.
+    
+    Args:
+        *matrices: Matrices to multiply, in order
+    
+    Returns:
+        dict: "order" (parenthesized product such as "(A0 (A1 A2))"),
+              "cost" (scalar multiplications of that order),
+              "left_to_right" (scalar multiplications multiplying left to
+              right) and "saved" (the difference)
+    """
+    dimensions = _chain_dimensions(matrices)
+    cost, split = chain_order(dimensions)
+    left_to_right = sum(dimensions[0] * dimensions[k] * dimensions[k + 1]
+                        for k in range(1, len(matrices)))
+    
+    def describe(i, j):
+        if i == j:
+            return f"A{i}"
+        k = split[i][j]
+        return f"({describe(i, k)} {describe(k + 1, j)})"
+    
+    return {
+        "order": describe(0, len(matrices) - 1),
+        "cost": cost,
+        "left_to_right": left_to_right,
+        "saved": left_to_right - cost,
+    }
+
+
+def multiply_chain(*matrices, block_size=64, backend="auto", report=False):
+    """
+    Multiply a chain of matrices in the cheapest order.
+    
+    The order is chosen by chain_order, which can make a chain with very
+    different shapes orders of magnitude cheaper than multiplying left to
+    right. The plan is then executed bottom up in pure Python: once an
+    intermediate product has been consumed its row lists go back to a
+    pool and are overwritten in place by later intermediates, so a long
+    chain needs only a couple of intermediate buffers. Steps big enough
+    for NumPy are handed to multiply_matrices instead.
+    
+    Args:
+        *matrices: Matrices (lists or Matrix) to multiply, in order
+        block_size (int): Column tile size of the pure-Python product
+        backend (str): Backend for each step, as in multiply_matrices
+        report (bool): Also return the plan from chain_plan
+    
+    Returns:
+        list or Matrix: Product of the chain, a Matrix if any input is one;
+                        with report, a (product, plan) tuple
+    """
+    dimensions = _chain_dimensions(matrices)
+    _, split = chain_order(dimensions)
+    operands = [_to_lists(matrix) for matrix in matrices]
+    pool = []
+    
+    def product(i, j):
+        if i == j:
+            return operands[i], False
+        k = split[i][j]
+        left, left_owned = product(i, k)
+        right, right_owned = product(k + 1, j)
+        
+        work = dimensions[i] * dimensions[k + 1] * dimensions[j + 1]
+        if backend != "python" and numpy is not None and work >= NUMPY_MIN_WORK:
+            result = multiply_matrices(left, right, backend=backend)
+        else:
+            result = _acquire_buffer(pool, dimensions[i], dimensions[j + 1])
+            _multiply_into(left, right, result, block_size)
+        
+        # Intermediates are dead once consumed; recycle their rows
+        for buffer, owned in ((left, left_owned), (right, right_owned)):
+            if owned:
+                pool.append(buffer)
+        return result, True
+    
+    result, owned = product(0, len(matrices) - 1)
+    if not owned:
+        result = [row[:] for row in result]
+    
+    if any(isinstance(matrix, Matrix) for matrix in matrices):
+        result = Matrix.from_lists(result, _result_typecode(result, matrices))
+    
+    if report:
+        return result, chain_plan(*matrices)
+    return result
+
+
+def matrix_power(matrix, k, modulus=None, block_size=64):
+    """
+    Raise a square matrix to an integer power by repeated squaring.
+    
+    Binary exponentiation needs O(log k) products instead of k - 1. The
+    products are written into two pairs of preallocated buffers that swap
+    roles after each step, so no new list of lists is allocated per
+    product. Diagonal matrices (detected with is_diagonal_matrix) just
+    raise each diagonal element to the power. Negative powers use the
+    inverse from the LU factorization.
+    
+    Args:
+        matrix (list or Matrix): Square matrix
+        k (int): Exponent
+        modulus (int): Reduce every element modulo this after each product
+                       (integer matrices only), keeping values small
+        block_size (int): Column tile size of the pure-Python product
+    
+    Returns:
+        list or Matrix: matrix ** k, a Matrix if the input is one (a list
+                        when a negative power of an integer Matrix leaves
+                        Fractions)
+    """
+    if not is_square_matrix(matrix):
+        raise ValueError("Matrix must be square")
+    if modulus is not None:
+        if modulus < 1:
+            raise ValueError("Modulus must be positive")
+        if any(type(value) is not int for row in _to_lists(matrix) for value in row):
+            raise ValueError("Modular powers need an integer matrix")
+    
+    as_matrix = isinstance(matrix, Matrix)
+    n = len(matrix)
+    if k < 0:
+        if modulus is not None:
+            raise ValueError("Negative powers are not supported with a modulus")
+        base = lu_decompose(matrix).inverse()
+        k = -k
+    else:
+        base = [list(row) for row in _to_lists(matrix)]
+    if modulus is not None:
+        base = [[value % modulus for value in row] for row in base]
+    
+    if is_diagonal_matrix(base):
+        result = [[0] * n for _ in range(n)]
+        for i in range(n):
+            result[i][i] = base[i][i] ** k if modulus is None else pow(base[i][i], k, modulus)
+    elif k == 0:
+        result = [[int(i == j) for j in range(n)] for i in range(n)]
+    else:
+        base_spare = [[0] * n for _ in range(n)]
+        result, result_spare = None, [[0] * n for _ in range(n)]
+        
+        while True:
+            if k & 1:
+                if result is None:
+                    # First factor: copy instead of multiplying by the identity
+                    result = [row[:] for row in base]
+                else:
+                    _multiply_into(result, base, result_spare, block_size)
+                    result, result_spare = result_spare, result
+                    _reduce_modulo(result, modulus)
+            k >>= 1
+            if not k:
+                break
+            _multiply_into(base, base, base_spare, block_size)
+            base, base_spare = base_spare, base
+            _reduce_modulo(base, modulus)
+    
+    if as_matrix:
+        if any(type(value) is Fraction for row in result for value in row):
+            return result
+        return Matrix.from_lists(result, _result_typecode(result, (matrix,)))
+    return result
+
+
+def _reduce_modulo(matrix, modulus):
+    """
+    Reduce every element of a list of lists modulo modulus in place.
+    
+    Args:
+        matrix (list): Matrix (list of lists)
+        modulus (int): Modulus, or None to leave the matrix unchanged
+    """
+    if modulus is not None:
+        for row in matrix:
+            row[:] = [value % modulus for value in row]
+
+
+def _chain_dimensions(matrices):
+    """
+    Get the dimension list of a matrix chain.
+    
+    Args:
+        matrices (tuple): Matrices to multiply, in order
+    
+    Returns:
+        list: n + 1 sizes; matrix i is dimensions[i] x dimensions[i + 1]
+    """
+    if not matrices:
+        raise ValueError("At least one matrix is required")
+    for matrix1, matrix2 in zip(matrices, matrices[1:]):
+        if not can_multiply(matrix1, matrix2):
+            raise ValueError("Matrices are not compatible for multiplication")
+    
+    dimensions = [_shape(matrices[0])[0]]
+    dimensions.extend(_shape(matrix)[1] for matrix in matrices)
+    return dimensions
+
+
+def _acquire_buffer(pool, rows, cols):
+    """
+    Take a rows x cols buffer from the pool, resizing a recycled one.
+    
+    Args:
+        pool (list): Free buffers (lists of row lists)
+        rows (int): Number of rows needed
+        cols (int): Number of columns needed
+    
+    Returns:
+        list: Buffer whose contents will be overwritten
+    """
+    if not pool:
+        return [[0] * cols for _ in range(rows)]
+    
+    # The largest free buffer needs the least resizing
+    buffer = pool.pop(max(range(len(pool)), key=lambda index: len(pool[index])))
+    del buffer[rows:]
+    for row in buffer:
+        if len(row) > cols:
+            del row[cols:]
+        elif len(row) < cols:
+            row.extend(repeat(0, cols - len(row)))
+    buffer.extend([0] * cols for _ in range(rows - len(buffer)))
+    return buffer
+
+
+def _multiply_into(matrix1, matrix2, out, block_size):
+    """
+    Multiply two lists of lists into a preallocated result with column tiling.
+    
+    Args:
+        matrix1 (list): First matrix
+        matrix2 (list): Second matrix
+        out (list): Result buffer of the right shape, overwritten in place
+        block_size (int): Number of matrix2 columns per tile
+    """
+    columns = list(zip(*matrix2))
+    
+    for start in range(0, len(columns), block_size):
+        tile = columns[start:start + block_size]
+        stop = start + len(tile)
+        for row, out_row in zip(matrix1, out):
+            out_row[start:stop] = [sum(map(operator.mul, row, column)) for column in tile]
+
+
+def _numpy_operands(matrix1, matrix2):
+    """
+    Convert both matrices to NumPy arrays if the product can be exact.
+    
+    Args:
+        matrix1 (list or Matrix): First matrix
+        matrix2 (list or Matrix): Second matrix
+    
+    Returns:
+        tuple: (array1, array2), or None if NumPy is missing, the values are
+               not plain ints or floats, or int64 accumulation could overflow
+    """
+    if numpy is None:
+        return None
+    
+    try:
+        first = numpy.asarray(matrix1)
+        second = numpy.asarray(matrix2)
+    except (ValueError, TypeError, OverflowError):
+        return None
+    
+    if first.ndim != 2 or second.ndim != 2:
+        return None
+    if first.dtype.kind not in "if" or second.dtype.kind not in "if":
+        return None
+    
+    if first.dtype.kind == "i" and second.dtype.kind == "i" and first.size and second.size:
+        largest1 = max(-int(first.min()), int(first.max()))
+        largest2 = max(-int(second.min()), int(second.max()))
+        if not _product_fits_int64(largest1, largest2, first.shape[1]):
+            return None
+    
+    return first, second
+
+
+def _product_fits_int64(largest1, largest2, inner):
+    """
+    Check that every partial sum of a product stays within int64.
+    
+    Args:
+        largest1 (int): Largest absolute value in the first matrix
+        largest2 (int): Largest absolute value in the second matrix
+        inner (int): Shared dimension of the product
+    
+    Returns:
+        bool: True if no partial sum can overflow
+    """
+    return largest1 * largest2 * inner < 2 ** 63
+
+
+def _multiply_parallel(matrix1, matrix2, workers):
+    """
+    Multiply two matrices in a process pool over shared memory.
+    
+    matrix1 and the transpose of matrix2 are copied once into shared
+    memory blocks, and the workers write output rows into a third block.
+    
+    Args:
+        matrix1 (list or Matrix): First matrix
+        matrix2 (list or Matrix): Second matrix
+        workers (int): Number of worker processes
+    
+    Returns:
+        Matrix: Result of matrix multiplication, or None if the values are
+                not all ints and floats or do not fit in 64-bit shared buffers
+    """
+    first, second = _to_lists(matrix1), _to_lists(matrix2)
+    rows, inner, cols = len(first), len(second), len(second[0])
+    
+    # Only plain ints and floats survive the trip through a typed buffer;
+    # Fractions, Decimals and bools keep their exact single-process result
+    types = set(map(type, chain.from_iterable(first)))
+    types.update(map(type, chain.from_iterable(second)))
+    if not types <= {int, float}:
+        return None
+    
+    try:
+        if types <= {int}:
+            largest1 = max((abs(value) for row in first for value in row), default=0)
+            largest2 = max((abs(value) for row in second for value in row), default=0)
+            if not _product_fits_int64(largest1, largest2, inner):
+                return None
+            typecode = "q"
+        else:
+            typecode = "d"
+        values1 = array(typecode, chain.from_iterable(first))
+        values2 = array(typecode, chain.from_iterable(zip(*second)))
+    except (TypeError, OverflowError):
+        return None
+    
+    itemsize = values1.itemsize
+    blocks = []
+    try:
+        for size in (rows * inner, cols * inner, rows * cols):
+            blocks.append(shared_memory.SharedMemory(create=True, size=max(size * itemsize, 1)))
+        blocks[0].buf[:len(values1) * itemsize] = values1.tobytes()
+        blocks[1].buf[:len(values2) * itemsize] = values2.tobytes()
+        del values1, values2
+        
+        # Several row ranges per worker so uneven progress evens out
+        step = max(1, -(-rows // (workers * 4)))
+        ranges = [(start, min(start + step, rows)) for start in range(0, rows, step)]
+        names = [block.name for block in blocks]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach_operands,
+                                 initargs=(names, (rows, inner, cols), typecode)) as pool:
+            list(pool.map(_multiply_rows, ranges))
+        
+        result = array(typecode)
+        result.frombytes(blocks[2].buf[:rows * cols * itemsize])
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+    
+    return Matrix(rows, cols, data=result)
+
+
+# Shared operands of _multiply_parallel, attached once per worker process
+_worker_operands = {}
+
+
+def _attach_operands(names, shape, typecode):
+    """
+    Attach a worker process to the shared blocks of _multiply_parallel.
+    
+    Args:
+        names (list): Shared memory names of matrix1, transposed matrix2 and
+                      the output
+        shape (tuple): (rows, inner, cols) of the product
+        typecode (str): "q" or "d"
+    """
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    rows, inner, cols = shape
+    transposed = blocks[1].buf.cast(typecode)
+    _worker_operands.update(
+        blocks=blocks,
+        shape=shape,
+        typecode=typecode,
+        first=blocks[0].buf.cast(typecode),
+        # Columns of matrix2 as Python lists, built once per worker
+        columns=[transposed[j * inner:(j + 1) * inner].tolist() for j in range(cols)],
+        output=blocks[2].buf.cast(typecode),
+    )
+    transposed.release()
+
+
+def _multiply_rows(bounds):
+    """
+    Compute a range of output rows in a worker and store them in shared memory.
+    
+    Args:
+        bounds (tuple): (start, stop) output rows
+    """
+    start, stop = bounds
+    _, inner, cols = _worker_operands["shape"]
+    first = _worker_operands["first"]
+    output = _worker_operands["output"]
+    columns = _worker_operands["columns"]
+    typecode = _worker_operands["typecode"]
+    
+    for i in range(start, stop):
+        row = first[i * inner:(i + 1) * inner].tolist()
+        output[i * cols:(i + 1) * cols] = array(
+            typecode, [sum(map(operator.mul, row, column)) for column in columns])
+
+
+def _result_typecode(result, operands):
+    """
+    Pick the typecode for a product returned as a Matrix.
+    
+    Args:
+        result (list): Product (list of lists)
+        operands (tuple): Matrices the product was computed from
+    
+    Returns:
+        str: "d" if any Matrix operand is a float matrix or any value of
+             the product is a float, "q" otherwise
+    """
+    if any(isinstance(m, Matrix) and m.typecode == "d" for m in operands):
+        return "d"
+    if any(type(value) is float for row in result for value in row):
+        return "d"
+    return "q"
+
+
+def _to_lists(matrix):
+    """
+    Get a list-of-lists form of a matrix, copying only Matrix objects.
+    
+    Args:
+        matrix (list, Matrix or SparseMatrix): Matrix to convert
+    
+    Returns:
+        list: Matrix (list of lists)
+    """
+    if isinstance(matrix, (Matrix, SparseMatrix, MappedMatrix)):
+        return matrix.tolist()
+    return matrix
+
+
+def lu_decompose(matrix, exact=None):
+    """
+    Factor a square matrix with partial pivoting.
+    
+    A Matrix caches its factorization (see Matrix.lu), so repeated calls
+    on the same unmodified Matrix do no work.
+    
+    Args:
+        matrix (list or Matrix): Square matrix
+        exact (bool): Factor with Fractions (default: when every value is
+                      an int)
+    
+    Returns:
+        LUDecomposition: Factorization providing det, solve and inverse
+    """
+    if isinstance(matrix, Matrix):
+        return matrix.lu(exact)
+    if exact is None:
+        exact = all(type(value) is int for row in matrix for value in row)
+    return LUDecomposition(matrix, exact)
+
+
+def max_sum_submatrix(matrix, workers=None):
+    """
+    Find the rectangle of cells with the largest sum.
+    
+    Every pair of top and bottom rows is compressed into one row of column
+    sums, which is then searched with Kadane's algorithm, for O(r^2 * c)
+    time with r the smaller dimension. With NumPy installed all bottom rows
+    for a given top row are searched in one vectorized step.
+    
+    Args:
+        matrix (list): Non-empty matrix (list of lists) of numbers
+        workers (int): Number of processes to split the top rows across
+                       (default None runs in the current process)
+    
+    Returns:
+        tuple: (sum, top, left, bottom, right) with all bounds inclusive
+    """
+    matrix = _to_lists(matrix)
+    if not matrix or not matrix[0]:
+        raise ValueError("Matrix must not be empty")
+    
+    # Pair up the shorter dimension to keep the quadratic factor small
+    transposed = len(matrix) > len(matrix[0])
+    if transposed:
+        matrix = [list(column) for column in zip(*matrix)]
+    
+    tops = range(len(matrix))
+    workers = min(workers or 1, len(tops))
+    if workers > 1:
+        groups = [tops[i::workers] for i in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_set_shared_matrix,
+                                 initargs=(matrix,)) as pool:
+            results = list(pool.map(_best_rectangle_from_tops, groups))
+        
+        # Each top row lives in one group, so keeping the first of equal
+        # sums in top row order picks what the sequential scan would
+        best = None
+        for candidate in sorted(results, key=operator.itemgetter(1)):
+            if best is None or candidate[0] > best[0]:
+                best = candidate
+    else:
+        best = _best_rectangle_from_tops(tops, matrix)
+    
+    total, top, left, bottom, right = best
+    if transposed:
+        return (total, left, top, right, bottom)
+    return best
+
+
+# Matrix searched by max_sum_submatrix, set once per worker process
+_shared_matrix = None
+
+
+def _set_shared_matrix(matrix):
+    """
+    Store the matrix searched by _best_rectangle_from_tops.
+    
+    Args:
+        matrix (list): Matrix (list of lists)
+    """
+    global _shared_matrix
+    _shared_matrix = matrix
+
+
+def _best_rectangle_from_tops(tops, matrix=None):
+    """
+    Find the best rectangle whose top row is one of the given rows.
+    
+    Args:
+        tops (iterable): Candidate top row indices
+        matrix (list): Matrix to search (default: the worker's shared matrix)
+    
+    Returns:
+        tuple: (sum, top, left, bottom, right), or None if tops is empty
+    """
+    if matrix is None:
+        matrix = _shared_matrix
+    best = None
+    
+    if numpy is not None:
+        array = numpy.asarray(matrix)
+        for top in tops:
+            candidate = _best_rectangle_numpy(array, top)
+            if best is None or candidate[0] > best[0]:
+                best = candidate
+        return best
+    
+    cols = len(matrix[0])
+    for top in tops:
+        column_sums = [0] * cols
+        for bottom in range(top, len(matrix)):
+            column_sums = list(map(operator.add, column_sums, matrix[bottom]))
+            total, left, right = summarize_subarray(column_sums).best
+            if best is None or total > best[0]:
+                best = (total, top, left, bottom, right)
+    return best
+
+
+def _best_rectangle_numpy(array, top):
+    """
+    Vectorized search of all rectangles starting at one top row.
+    
+    Args:
+        array (numpy.ndarray): 2D array of numbers
+        top (int): Top row of the rectangles
+    
+    Returns:
+        tuple: (sum, top, left, bottom, right) of the best rectangle
+    """
+    # Row b of column_sums covers rows top..top + b
+    column_sums = numpy.cumsum(array[top:], axis=0)
+    height, cols = column_sums.shape
+    sums = numpy.concatenate((numpy.zeros((height, 1), dtype=column_sums.dtype),
+                              numpy.cumsum(column_sums, axis=1)), axis=1)
+    before = sums[:, :-1]
+    gains = sums[:, 1:] - numpy.minimum.accumulate(before, axis=1)
+    
+    offset, right = divmod(int(numpy.argmax(gains)), cols)
+    left = int(numpy.argmin(before[offset, :right + 1]))
+    return (gains[offset, right].item(), top, left, top + offset, right)
+
+
+# Example usage
+def demo():
+    """Demonstrate matrix operations."""
+    # Create random matrices
+    matrix1 = create_random_matrix(3, 3)
+    matrix2 = create_random_matrix(3, 2)
+    
+    print("Matrix 1:")
+    print_matrix(matrix1)
+    
+    print("\nMatrix 2:")
+    print_matrix(matrix2)
+    
+    # Check if matrix1 is square
+    print(f"\nMatrix 1 is square: {is_square_matrix(matrix1)}")
     
     # Check if matrix1 is diagonal
     print(f"Matrix 1 is diagonal: {is_diagonal_matrix(matrix1)}")
@@ -187,6 +2385,41 @@ def demo():
     print_matrix(diagonal_matrix)
     print(f"Is diagonal: {is_diagonal_matrix(diagonal_matrix)}")
     print(f"Diagonal sum: {diagonal_sum(diagonal_matrix)}")
+    
+    # Array-backed matrices share one buffer between views
+    packed = Matrix.from_lists(diagonal_matrix)
+    print(f"\n{packed} transposed view: {packed.T.tolist()}")
+    print(f"Column 1 view: {packed.column(1).tolist()}")
+    print(f"Is diagonal: {is_diagonal_matrix(packed)}, diagonal sum: {diagonal_sum(packed)}")
+    
+    # LU factorization is cached until the matrix is written to
+    system = Matrix.from_lists([[2, 1], [1, 3]])
+    print(f"\nDeterminant of {system.tolist()}: {system.det()}")
+    print(f"Solutions for right-hand sides (3, 5) and (1, 0): {system.solve([[3, 1], [5, 0]])}")
+    
+    # Powers by repeated squaring, here Fibonacci numbers modulo 10^9 + 7
+    fibonacci = matrix_power([[1, 1], [1, 0]], 10 ** 18, modulus=10 ** 9 + 7)
+    print(f"\nFibonacci(10^18) mod 10^9 + 7: {fibonacci[0][1]}")
+    
+    # Seeded bulk generation of structured matrices
+    banded = create_random_matrix(5, 5, 1, 9, seed=7, structure="banded", output="sparse")
+    print(f"\nRandom banded matrix ({banded.nnz} non-zeros):")
+    print_matrix(banded.tolist())
+    
+    # Chains are multiplied in the cheapest order
+    chain = [create_random_matrix(10, 2), create_random_matrix(2, 10), create_random_matrix(10, 2)]
+    _, plan = multiply_chain(*chain, report=True)
+    print(f"\nChain order {plan['order']} saves {plan['saved']} of "
+          f"{plan['left_to_right']} scalar multiplications")
+    
+    # Memory-mapped matrices are multiplied tile by tile on disk
+    with tempfile.TemporaryDirectory() as directory:
+        with MappedMatrix.from_lists(os.path.join(directory, "a.mx"), matrix1) as mapped:
+            product = multiply_matrices(mapped, matrix2, out=os.path.join(directory, "ab.mx"),
+                                        memory_limit=1024)
+            print(f"\n{product}:")
+            print_matrix(product.tolist())
+            product.close()
 
 
 if __name__ == "__main__":